@@ -1,15 +1,21 @@
 """ETF tracking API routes."""
 
+from collections.abc import Iterable, Iterator
 from datetime import date, datetime
 from typing import Any
 
-from fastapi import APIRouter, Depends, HTTPException, Query
+import orjson
+from fastapi import APIRouter, Depends, HTTPException, Query, Request, Response
+from fastapi.responses import StreamingResponse
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func, and_
+from sqlalchemy import bindparam, case, select, func, and_
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from backend.app.core.http_cache import is_not_modified, make_etag, not_modified_response
 from backend.app.db.models import ETF, ETFHolding
 from backend.app.db.session import get_db
+from backend.app.services.cache import LocalTTLCache
 from backend.app.schemas.etfs import (
     ETFCreate,
     ETFUpdate,
@@ -25,6 +31,116 @@ from backend.app.schemas.etfs import (
 
 router = APIRouter()
 
+NDJSON_MEDIA_TYPE = "application/x-ndjson"
+
+# Separator for ETF names concatenated in SQL aggregates
+ETF_NAME_SEPARATOR = "\x1f"
+
+CHANGE_TYPES = ("new", "increased", "decreased", "sold")
+
+# Entries kept per change type in the aggregated changes view
+TOP_CHANGES_LIMIT = 50
+
+# Hot per-ETF statements, built once and executed with bound parameters so
+# requests skip statement construction and hit the compiled-statement cache.
+_ETF_LATEST_DATE_STMT = (
+    select(func.max(ETFHolding.holding_date))
+    .where(ETFHolding.etf_id == bindparam("etf_id"))
+)
+_ETF_HOLDINGS_AT_DATE_STMT = (
+    select(ETFHolding)
+    .where(ETFHolding.etf_id == bindparam("etf_id"))
+    .where(ETFHolding.holding_date == bindparam("holding_date"))
+)
+_ETF_CHANGES_AT_DATE_STMT = _ETF_HOLDINGS_AT_DATE_STMT.where(
+    ETFHolding.change_type.isnot(None)
+)
+_ETF_TOP_HOLDINGS_AT_DATE_STMT = (
+    _ETF_HOLDINGS_AT_DATE_STMT
+    .order_by(ETFHolding.market_value.desc())
+    .limit(bindparam("limit"))
+)
+
+# Active ETF (id, name, ticker) rows, shared by the hot read endpoints.
+# Invalidated by the CRUD handlers below; the TTL bounds staleness across workers.
+_active_etfs_cache = LocalTTLCache(ttl=10)
+
+
+async def _get_active_etfs(db: AsyncSession) -> list[Any]:
+    """Get active ETFs as (id, name, ticker) rows, cached in-process."""
+    active_etfs = _active_etfs_cache.get()
+    if active_etfs is None:
+        stmt = select(ETF.id, ETF.name, ETF.ticker).where(ETF.is_active == True)
+        result = await db.execute(stmt)
+        active_etfs = result.all()
+        _active_etfs_cache.set("default", active_etfs)
+    return active_etfs
+
+
+def _latest_holdings_cte():
+    """CTE of each ETF's latest holding date: (etf_id, holding_date)."""
+    return (
+        select(
+            ETFHolding.etf_id,
+            func.max(ETFHolding.holding_date).label("holding_date"),
+        )
+        .group_by(ETFHolding.etf_id)
+        .cte("latest_holdings")
+    )
+
+
+def _holding_key():
+    """Aggregation key: upper-cased ticker, falling back to company name."""
+    return case(
+        (ETFHolding.ticker != "", func.upper(ETFHolding.ticker)),
+        else_=ETFHolding.company_name,
+    )
+
+
+def _split_etf_names(etf_names: str | None) -> list[str]:
+    """Turn a SQL-concatenated ETF name list into sorted unique names."""
+    if not etf_names:
+        return []
+    return sorted(set(etf_names.split(ETF_NAME_SEPARATOR)))
+
+
+def _aggregated_holding(row: Any) -> dict[str, Any]:
+    """Build an aggregated holding entry from a grouped holdings row."""
+    return {
+        "ticker": row.ticker,
+        "company_name": row.company_name,
+        "shares": int(row.shares or 0),
+        "market_value": float(row.market_value),
+        # Average weight across the ETFs holding the position
+        "weight_pct": float(row.weight_pct) / row.etf_count,
+        "etf_count": row.etf_count,
+        "etf_names": _split_etf_names(row.etf_names),
+    }
+
+
+def _iter_ndjson(rows: Iterable[Any]) -> Iterator[bytes]:
+    """Serialize grouped holdings rows as newline-delimited JSON, one per line.
+
+    Each entry is built as it is sent, so only one row's dict is alive at a time.
+    """
+    for row in rows:
+        yield orjson.dumps(_aggregated_holding(row)) + b"\n"
+
+
+def _empty_holdings_response(stream: bool) -> ETFHoldingsResponse | Response:
+    """Build the aggregated holdings response for when there is no data."""
+    if stream:
+        return StreamingResponse(
+            iter(()), media_type=NDJSON_MEDIA_TYPE, headers={"Vary": "Accept"}
+        )
+    return ETFHoldingsResponse(
+        etf_id=0,
+        etf_name="ALL ETFs",
+        holding_date=None,
+        holdings=[],
+        total_value=0,
+    )
+
 
 # ============================================================================
 # List and CRUD Operations
@@ -85,9 +201,7 @@ async def check_etf_updates(
             pass
 
     # Get all active ETFs
-    stmt = select(ETF).where(ETF.is_active == True)
-    result = await db.execute(stmt)
-    etfs = result.scalars().all()
+    etfs = await _get_active_etfs(db)
 
     updates = []
     has_any_updates = False
@@ -143,23 +257,27 @@ async def check_etf_updates(
 
 @router.get("/aggregate/holdings", response_model=ETFHoldingsResponse)
 async def get_aggregated_holdings(
+    request: Request,
+    response: Response,
     limit: int = Query(default=50, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
-) -> ETFHoldingsResponse:
-    """Get aggregated holdings across all active ETFs."""
+) -> ETFHoldingsResponse | Response:
+    """Get aggregated holdings across all active ETFs.
+
+    Supports conditional GET: the ETag changes only when the latest holding
+    date or the number of active ETFs changes, so polling clients get a 304.
+
+    Clients sending ``Accept: application/x-ndjson`` receive the holdings as
+    a stream of one JSON object per line, with ``holding_date`` and
+    ``total_value`` in the ``X-Holding-Date`` / ``X-Total-Value`` headers.
+    """
+    stream = NDJSON_MEDIA_TYPE in request.headers.get("accept", "")
+
     # Get all active ETFs
-    etfs_stmt = select(ETF).where(ETF.is_active == True)
-    etfs_result = await db.execute(etfs_stmt)
-    active_etfs = etfs_result.scalars().all()
+    active_etfs = await _get_active_etfs(db)
 
     if not active_etfs:
-        return ETFHoldingsResponse(
-            etf_id=0,
-            etf_name="ALL ETFs",
-            holding_date=None,
-            holdings=[],
-            total_value=0,
-        )
+        return _empty_holdings_response(stream)
 
     # Get latest holding date across all ETFs
     latest_date_stmt = select(func.max(ETFHolding.holding_date))
@@ -167,79 +285,66 @@ async def get_aggregated_holdings(
     latest_date = result.scalar()
 
     if not latest_date:
-        return ETFHoldingsResponse(
-            etf_id=0,
-            etf_name="ALL ETFs",
-            holding_date=None,
-            holdings=[],
-            total_value=0,
-        )
-
-    # Aggregate holdings by ticker
-    aggregated_holdings: dict[str, dict] = {}
-    total_value = 0.0
+        return _empty_holdings_response(stream)
 
-    for etf in active_etfs:
-        # Get latest holding date for this ETF
-        etf_latest_stmt = (
-            select(func.max(ETFHolding.holding_date))
-            .where(ETFHolding.etf_id == etf.id)
+    etag = make_etag(
+        latest_date.isoformat(), len(active_etfs), limit, "ndjson" if stream else "json"
+    )
+    if is_not_modified(request, etag):
+        return not_modified_response(etag)
+    response.headers["ETag"] = etag
+    response.headers["Vary"] = "Accept"
+
+    # Aggregate each active ETF's latest holdings by ticker (falling back to
+    # company name) in one statement. Sorting and the top-N cut happen in SQL,
+    # and the grand total rides along as a window over all groups.
+    latest = _latest_holdings_cte()
+    holding_key = _holding_key()
+    value_sum = func.sum(func.coalesce(ETFHolding.market_value, 0))
+    aggregate_stmt = (
+        select(
+            func.min(ETFHolding.ticker).label("ticker"),
+            func.min(ETFHolding.company_name).label("company_name"),
+            func.sum(func.coalesce(ETFHolding.shares, 0)).label("shares"),
+            value_sum.label("market_value"),
+            func.sum(func.coalesce(ETFHolding.weight_pct, 0)).label("weight_pct"),
+            func.count().label("etf_count"),
+            func.aggregate_strings(ETF.name, ETF_NAME_SEPARATOR).label("etf_names"),
+            func.sum(value_sum).over().label("total_value"),
         )
-        etf_result = await db.execute(etf_latest_stmt)
-        etf_latest_date = etf_result.scalar()
-
-        if not etf_latest_date:
-            continue
-
-        # Get holdings for this ETF
-        holdings_stmt = (
-            select(ETFHolding)
-            .where(ETFHolding.etf_id == etf.id)
-            .where(ETFHolding.holding_date == etf_latest_date)
+        .join(
+            latest,
+            (latest.c.etf_id == ETFHolding.etf_id)
+            & (latest.c.holding_date == ETFHolding.holding_date),
+        )
+        .join(ETF, ETF.id == ETFHolding.etf_id)
+        .where(ETF.is_active == True)
+        .group_by(holding_key)
+        .order_by(value_sum.desc())
+        .limit(limit)
+    )
+    result = await db.execute(aggregate_stmt)
+    rows = result.all()
+
+    total_value = float(rows[0].total_value) if rows else 0.0
+
+    if stream:
+        return StreamingResponse(
+            _iter_ndjson(rows),
+            media_type=NDJSON_MEDIA_TYPE,
+            headers={
+                "ETag": etag,
+                "Vary": "Accept",
+                "X-Holding-Date": latest_date.isoformat(),
+                "X-Total-Value": str(total_value),
+            },
         )
-        holdings_result = await db.execute(holdings_stmt)
-        holdings = holdings_result.scalars().all()
-
-        for h in holdings:
-            key = h.ticker.upper() if h.ticker else h.company_name
-
-            if key not in aggregated_holdings:
-                aggregated_holdings[key] = {
-                    "ticker": h.ticker,
-                    "company_name": h.company_name,
-                    "shares": 0,
-                    "market_value": 0.0,
-                    "weight_pct": 0.0,
-                    "etf_count": 0,
-                    "etf_names": [],
-                }
-
-            aggregated_holdings[key]["shares"] += h.shares or 0
-            aggregated_holdings[key]["market_value"] += float(h.market_value or 0)
-            aggregated_holdings[key]["weight_pct"] += float(h.weight_pct or 0)
-            aggregated_holdings[key]["etf_count"] += 1
-            if etf.name not in aggregated_holdings[key]["etf_names"]:
-                aggregated_holdings[key]["etf_names"].append(etf.name)
-
-            total_value += float(h.market_value or 0)
-
-    # Sort by market value and limit
-    sorted_holdings = sorted(
-        aggregated_holdings.values(),
-        key=lambda x: x["market_value"],
-        reverse=True,
-    )[:limit]
-
-    # Calculate average weight for aggregated holdings
-    for h in sorted_holdings:
-        if h["etf_count"] > 0:
-            h["weight_pct"] = h["weight_pct"] / h["etf_count"]
 
     return ETFHoldingsResponse(
         etf_id=0,
         etf_name="ALL ETFs",
         holding_date=latest_date,
-        holdings=sorted_holdings,
+        holdings=[_aggregated_holding(row) for row in rows],
         total_value=total_value,
     )
 
@@ -250,9 +355,7 @@ async def get_aggregated_changes(
 ) -> ETFChangesResponse:
     """Get aggregated position changes across all active ETFs."""
     # Get all active ETFs
-    etfs_stmt = select(ETF).where(ETF.is_active == True)
-    etfs_result = await db.execute(etfs_stmt)
-    active_etfs = etfs_result.scalars().all()
+    active_etfs = await _get_active_etfs(db)
 
     if not active_etfs:
         return ETFChangesResponse(
@@ -265,78 +368,75 @@ async def get_aggregated_changes(
             sold=[],
         )
 
-    new_positions: dict[str, dict] = {}
-    increased: dict[str, dict] = {}
-    decreased: dict[str, dict] = {}
-    sold: dict[str, dict] = {}
-    latest_date = None
+    # Latest holding date across the active ETFs
+    latest_date_stmt = (
+        select(func.max(ETFHolding.holding_date))
+        .join(ETF, ETF.id == ETFHolding.etf_id)
+        .where(ETF.is_active == True)
+    )
+    result = await db.execute(latest_date_stmt)
+    latest_date = result.scalar()
 
-    for etf in active_etfs:
-        # Get latest holding date for this ETF
-        etf_latest_stmt = (
-            select(func.max(ETFHolding.holding_date))
-            .where(ETFHolding.etf_id == etf.id)
+    # Group each active ETF's latest changes by change type and holding in
+    # one statement, keeping the top entries of each type by market value.
+    latest = _latest_holdings_cte()
+    value_sum = func.sum(func.coalesce(ETFHolding.market_value, 0))
+    grouped = (
+        select(
+            ETFHolding.change_type,
+            func.min(ETFHolding.ticker).label("ticker"),
+            func.min(ETFHolding.company_name).label("company_name"),
+            func.sum(func.coalesce(ETFHolding.shares, 0)).label("shares"),
+            value_sum.label("market_value"),
+            func.avg(func.coalesce(ETFHolding.weight_pct, 0)).label("weight_pct"),
+            func.sum(ETFHolding.shares_change).label("shares_change"),
+            func.avg(ETFHolding.weight_change).label("weight_change"),
+            func.count().label("etf_count"),
+            func.aggregate_strings(ETF.name, ETF_NAME_SEPARATOR).label("etf_names"),
+            func.row_number()
+            .over(partition_by=ETFHolding.change_type, order_by=value_sum.desc())
+            .label("change_rank"),
         )
-        etf_result = await db.execute(etf_latest_stmt)
-        etf_latest_date = etf_result.scalar()
-
-        if not etf_latest_date:
-            continue
-
-        if latest_date is None or etf_latest_date > latest_date:
-            latest_date = etf_latest_date
-
-        # Get holdings with changes
-        holdings_stmt = (
-            select(ETFHolding)
-            .where(ETFHolding.etf_id == etf.id)
-            .where(ETFHolding.holding_date == etf_latest_date)
-            .where(ETFHolding.change_type.isnot(None))
+        .join(
+            latest,
+            (latest.c.etf_id == ETFHolding.etf_id)
+            & (latest.c.holding_date == ETFHolding.holding_date),
         )
-        holdings_result = await db.execute(holdings_stmt)
-        holdings = holdings_result.scalars().all()
-
-        for h in holdings:
-            key = h.ticker.upper() if h.ticker else h.company_name
-            holding_data = {
-                "ticker": h.ticker,
-                "company_name": h.company_name,
-                "shares": h.shares or 0,
-                "market_value": float(h.market_value or 0),
-                "weight_pct": float(h.weight_pct or 0),
-                "shares_change": h.shares_change,
-                "weight_change": float(h.weight_change or 0) if h.weight_change else None,
-                "etf_count": 1,
-                "etf_names": [etf.name],
-            }
-
-            target_dict = None
-            if h.change_type == "new":
-                target_dict = new_positions
-            elif h.change_type == "increased":
-                target_dict = increased
-            elif h.change_type == "decreased":
-                target_dict = decreased
-            elif h.change_type == "sold":
-                target_dict = sold
-
-            if target_dict is not None:
-                if key in target_dict:
-                    target_dict[key]["shares"] += holding_data["shares"]
-                    target_dict[key]["market_value"] += holding_data["market_value"]
-                    target_dict[key]["etf_count"] += 1
-                    target_dict[key]["etf_names"].append(etf.name)
-                else:
-                    target_dict[key] = holding_data
+        .join(ETF, ETF.id == ETFHolding.etf_id)
+        .where(ETF.is_active == True)
+        .where(ETFHolding.change_type.in_(CHANGE_TYPES))
+        .group_by(ETFHolding.change_type, _holding_key())
+        .subquery()
+    )
+    changes_stmt = (
+        select(grouped)
+        .where(grouped.c.change_rank <= TOP_CHANGES_LIMIT)
+        .order_by(grouped.c.change_type, grouped.c.change_rank)
+    )
+    result = await db.execute(changes_stmt)
+
+    changes_by_type: dict[str, list[dict]] = {change_type: [] for change_type in CHANGE_TYPES}
+    for row in result:
+        changes_by_type[row.change_type].append({
+            "ticker": row.ticker,
+            "company_name": row.company_name,
+            "shares": int(row.shares),
+            "market_value": float(row.market_value),
+            "weight_pct": float(row.weight_pct),
+            "shares_change": int(row.shares_change) if row.shares_change is not None else None,
+            "weight_change": float(row.weight_change) if row.weight_change is not None else None,
+            "etf_count": row.etf_count,
+            "etf_names": _split_etf_names(row.etf_names),
+        })
 
     return ETFChangesResponse(
         etf_id=0,
         etf_name="ALL ETFs",
         holding_date=latest_date,
-        new_positions=list(new_positions.values())[:50],
-        increased=list(increased.values())[:50],
-        decreased=list(decreased.values())[:50],
-        sold=list(sold.values())[:50],
+        new_positions=changes_by_type["new"],
+        increased=changes_by_type["increased"],
+        decreased=changes_by_type["decreased"],
+        sold=changes_by_type["sold"],
     )
 
 
@@ -361,11 +461,7 @@ async def get_etf_holdings(
         raise HTTPException(status_code=404, detail=f"ETF with id {etf_id} not found")
 
     # Get latest holding date
-    latest_stmt = (
-        select(func.max(ETFHolding.holding_date))
-        .where(ETFHolding.etf_id == etf_id)
-    )
-    latest_result = await db.execute(latest_stmt)
+    latest_result = await db.execute(_ETF_LATEST_DATE_STMT, {"etf_id": etf_id})
     latest_date = latest_result.scalar()
 
     if not latest_date:
@@ -378,14 +474,10 @@ async def get_etf_holdings(
         )
 
     # Get holdings
-    holdings_stmt = (
-        select(ETFHolding)
-        .where(ETFHolding.etf_id == etf_id)
-        .where(ETFHolding.holding_date == latest_date)
-        .order_by(ETFHolding.market_value.desc())
-        .limit(limit)
+    holdings_result = await db.execute(
+        _ETF_TOP_HOLDINGS_AT_DATE_STMT,
+        {"etf_id": etf_id, "holding_date": latest_date, "limit": limit},
     )
-    holdings_result = await db.execute(holdings_stmt)
     holdings = holdings_result.scalars().all()
 
     total_value = sum(float(h.market_value or 0) for h in holdings)
@@ -427,11 +519,7 @@ async def get_etf_changes(
         raise HTTPException(status_code=404, detail=f"ETF with id {etf_id} not found")
 
     # Get latest holding date
-    latest_stmt = (
-        select(func.max(ETFHolding.holding_date))
-        .where(ETFHolding.etf_id == etf_id)
-    )
-    latest_result = await db.execute(latest_stmt)
+    latest_result = await db.execute(_ETF_LATEST_DATE_STMT, {"etf_id": etf_id})
     latest_date = latest_result.scalar()
 
     if not latest_date:
@@ -446,21 +534,29 @@ async def get_etf_changes(
         )
 
     # Get holdings with changes
-    holdings_stmt = (
-        select(ETFHolding)
-        .where(ETFHolding.etf_id == etf_id)
-        .where(ETFHolding.holding_date == latest_date)
+    holdings_result = await db.execute(
+        _ETF_CHANGES_AT_DATE_STMT,
+        {"etf_id": etf_id, "holding_date": latest_date},
     )
-    holdings_result = await db.execute(holdings_stmt)
     holdings = holdings_result.scalars().all()
 
     new_positions = []
     increased = []
     decreased = []
     sold = []
+    changes_by_type = {
+        "new": new_positions,
+        "increased": increased,
+        "decreased": decreased,
+        "sold": sold,
+    }
 
     for h in holdings:
-        holding_data = {
+        target_list = changes_by_type.get(h.change_type)
+        if target_list is None:
+            continue
+
+        target_list.append({
             "ticker": h.ticker,
             "company_name": h.company_name,
             "shares": h.shares,
@@ -468,16 +564,7 @@ async def get_etf_changes(
             "weight_pct": float(h.weight_pct) if h.weight_pct else None,
             "shares_change": h.shares_change,
             "weight_change": float(h.weight_change) if h.weight_change else None,
-        }
-
-        if h.change_type == "new":
-            new_positions.append(holding_data)
-        elif h.change_type == "increased":
-            increased.append(holding_data)
-        elif h.change_type == "decreased":
-            decreased.append(holding_data)
-        elif h.change_type == "sold":
-            sold.append(holding_data)
+        })
 
     return ETFChangesResponse(
         etf_id=etf.id,
@@ -500,66 +587,56 @@ async def add_etf(
     data: ETFCreate,
     db: AsyncSession = Depends(get_db),
 ) -> ETFInfo:
-    """Add a new ETF to track."""
-    # Check if ETF with same ticker already exists
-    existing_stmt = select(ETF).where(ETF.ticker == data.ticker.upper())
-    existing_result = await db.execute(existing_stmt)
-    existing = existing_result.scalar_one_or_none()
-
-    if existing:
-        if existing.is_active:
-            raise HTTPException(
-                status_code=400,
-                detail=f"ETF with ticker {data.ticker} already exists"
-            )
-        else:
-            # Reactivate inactive ETF
-            existing.is_active = True
-            existing.url = data.url
-            existing.agent_command = data.agent_command
-            existing.description = data.description
-            existing.category = data.category
-            existing.updated_at = datetime.now()
-            await db.commit()
-            await db.refresh(existing)
-            return ETFInfo(
-                id=existing.id,
-                name=existing.name,
-                ticker=existing.ticker,
-                url=existing.url,
-                agent_command=existing.agent_command,
-                description=existing.description,
-                category=existing.category,
-                priority=existing.priority,
-                is_active=existing.is_active,
-                last_scrape_at=existing.last_scrape_at,
-                last_scrape_success=existing.last_scrape_success,
-                last_scrape_error=existing.last_scrape_error,
-                created_at=existing.created_at,
-                updated_at=existing.updated_at,
-            )
-
-    # Get max priority for category
-    priority_stmt = (
-        select(func.max(ETF.priority))
+    """Add a new ETF to track.
+
+    Inserts the ETF, or reactivates an inactive one with the same ticker, in a
+    single upsert. The priority of a new ETF is computed in SQL as the next
+    free slot in its category.
+    """
+    next_priority = (
+        select(func.coalesce(func.max(ETF.priority), 0) + 1)
         .where(ETF.category == data.category)
+        .scalar_subquery()
     )
-    priority_result = await db.execute(priority_stmt)
-    max_priority = priority_result.scalar() or 0
-
-    # Create new ETF
-    etf = ETF(
-        name=data.name,
-        ticker=data.ticker.upper(),
-        url=data.url,
-        agent_command=data.agent_command,
-        description=data.description,
-        category=data.category,
-        priority=max_priority + 1,
+    stmt = (
+        insert(ETF)
+        .values(
+            name=data.name,
+            ticker=data.ticker.upper(),
+            url=data.url,
+            agent_command=data.agent_command,
+            description=data.description,
+            category=data.category,
+            priority=next_priority,
+            is_active=True,
+        )
+        .on_conflict_do_update(
+            index_elements=["ticker"],
+            set_={
+                "is_active": True,
+                "url": data.url,
+                "agent_command": data.agent_command,
+                "description": data.description,
+                "category": data.category,
+                "updated_at": func.now(),
+            },
+            # Only inactive ETFs are reactivated; active ones are a conflict
+            where=ETF.is_active == False,
+        )
+        .returning(ETF)
+        .execution_options(populate_existing=True)
     )
-    db.add(etf)
+    result = await db.execute(stmt)
+    etf = result.scalar_one_or_none()
+
+    if not etf:
+        raise HTTPException(
+            status_code=400,
+            detail=f"ETF with ticker {data.ticker} already exists"
+        )
+
     await db.commit()
-    await db.refresh(etf)
+    _active_etfs_cache.invalidate()
 
     # Trigger initial data fetch
     from backend.app.tasks.etfs import refresh_single_etf
@@ -613,6 +690,7 @@ async def update_etf(
 
     etf.updated_at = datetime.now()
     await db.commit()
+    _active_etfs_cache.invalidate()
     await db.refresh(etf)
 
     return ETFInfo(
@@ -649,6 +727,7 @@ async def delete_etf(
     etf.is_active = False
     etf.updated_at = datetime.now()
     await db.commit()
+    _active_etfs_cache.invalidate()
 
     return {"message": f"ETF {etf.ticker} deactivated successfully"}
 
@@ -662,20 +741,23 @@ async def delete_etf(
 async def refresh_all_etfs(
     db: AsyncSession = Depends(get_db),
 ) -> ETFRefreshResponse:
-    """Trigger refresh of all active ETFs."""
+    """Trigger refresh of all active ETFs.
+
+    The active ETF count comes from the shared in-process active ETF cache,
+    so repeated triggers usually skip the database; poll the returned job id
+    for the per-ETF results.
+    """
     from backend.app.tasks.etfs import refresh_all_etfs as refresh_task
 
-    # Count active ETFs
-    stmt = select(func.count(ETF.id)).where(ETF.is_active == True)
-    result = await db.execute(stmt)
-    count = result.scalar() or 0
+    count = len(await _get_active_etfs(db))
 
     # Trigger background task
-    refresh_task.delay()
+    task = refresh_task.delay()
 
     return ETFRefreshResponse(
         message=f"Refresh started for {count} ETF(s)",
         etfs_queued=count,
+        job_id=task.id,
     )
 
 
@@ -1,16 +1,25 @@
 """Fund tracking API routes."""
 
-from datetime import date
+from datetime import date, datetime, timezone
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, HTTPException, Path, Query
+import structlog
+from fastapi import APIRouter, Depends, HTTPException, Path, Query, Request, Response
 from pydantic import BaseModel, Field
-from sqlalchemy import select, func
+from sqlalchemy import Float, case, cast, select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.exceptions import NotFoundException
+from backend.app.core.http_cache import is_not_modified, make_etag, not_modified_response
+from backend.app.core.responses import ORJSONResponse
 from backend.app.db.models import Fund, FundHolding
 from backend.app.db.session import get_db
+from backend.app.services.cache import (
+    FUND_AGGREGATE_PATTERN,
+    CacheService,
+    cache,
+    fund_aggregate_key,
+)
 from backend.app.services.cusip_mapper import get_ticker_or_cusip, lookup_cusips_batch, is_cusip
 from backend.app.schemas.funds import (
     FundListResponse,
@@ -18,9 +27,77 @@ from backend.app.schemas.funds import (
     FundChangesResponse,
 )
 from backend.app.services.fund_validator import get_fund_validator
+from backend.app.services.sec_edgar import get_sec_edgar_client
+from backend.app.tasks.funds import check_fund_holdings, refresh_single_fund
+
+logger = structlog.get_logger(__name__)
 
 router = APIRouter()
 
+# Holding change types reported by the changes endpoints
+CHANGE_TYPES = ("new", "increased", "decreased", "sold")
+
+# Separator for fund names concatenated in SQL aggregates (ASCII unit separator)
+FUND_NAME_SEPARATOR = "\x1f"
+
+# Client-side cache policy for per-fund holdings (13F data changes quarterly)
+HOLDINGS_CACHE_CONTROL = "private, max-age=30"
+
+# Rows fetched per round-trip when streaming unbounded holding queries
+STREAM_CHUNK_SIZE = 500
+
+# Columns the per-fund holdings/changes endpoints read; selecting them as plain
+# rows skips ORM instance hydration and identity-map bookkeeping. Numeric
+# columns are cast to floats in SQL so rows serialize without Decimal
+# conversions in Python.
+HOLDING_ROW_COLUMNS = (
+    FundHolding.ticker,
+    FundHolding.company_name,
+    FundHolding.shares,
+    cast(FundHolding.value, Float).label("value"),
+    cast(FundHolding.percentage, Float).label("percentage"),
+    FundHolding.change_type,
+    FundHolding.shares_change,
+)
+
+
+def _latest_filings_cte():
+    """CTE of each fund's latest filing date: (fund_id, filing_date)."""
+    return (
+        select(
+            FundHolding.fund_id,
+            func.max(FundHolding.filing_date).label("filing_date"),
+        )
+        .group_by(FundHolding.fund_id)
+        .cte("latest_filings")
+    )
+
+
+def _value_change_expr():
+    """SQL expression for a holding's value change in USD.
+
+    New and sold positions change by their entire value; increased/decreased
+    positions by the value of the shares changed.
+    """
+    return case(
+        (FundHolding.change_type == "new", cast(FundHolding.value, Float)),
+        (FundHolding.change_type == "sold", -cast(FundHolding.value, Float)),
+        (
+            (FundHolding.shares != 0) & (FundHolding.shares_change != 0),
+            cast(FundHolding.shares_change, Float)
+            / cast(FundHolding.shares, Float)
+            * cast(FundHolding.value, Float),
+        ),
+        else_=0.0,
+    )
+
+
+def _split_fund_names(fund_names: str | None) -> list[str]:
+    """Turn a SQL-concatenated fund name list into sorted unique names."""
+    if not fund_names:
+        return []
+    return sorted(set(fund_names.split(FUND_NAME_SEPARATOR)))
+
 
 # Request/Response models
 class AddFundRequest(BaseModel):
@@ -77,12 +154,20 @@ async def list_funds(
     active_only: bool = Query(default=True),
     funds_only: bool = Query(default=True, description="Exclude ETFs, show only funds"),
     db: AsyncSession = Depends(get_db),
-) -> FundListResponse:
+) -> FundListResponse | Response:
     """List all tracked funds.
 
     Returns funds grouped by category with basic information.
     """
-    stmt = select(Fund).order_by(Fund.category, Fund.priority)
+    # Select just the listed columns; the row mappings are returned as-is
+    stmt = select(
+        Fund.id,
+        Fund.name,
+        Fund.ticker,
+        Fund.cik,
+        Fund.category,
+        Fund.priority,
+    ).order_by(Fund.category, Fund.priority)
 
     if category:
         stmt = stmt.where(Fund.category == category)
@@ -92,47 +177,20 @@ async def list_funds(
         stmt = stmt.where(Fund.fund_type == "fund")
 
     result = await db.execute(stmt)
-    funds = result.scalars().all()
+    funds = [dict(row) for row in result.mappings()]
 
-    return FundListResponse(
-        total=len(funds),
-        funds=[
-            {
-                "id": f.id,
-                "name": f.name,
-                "ticker": f.ticker,
-                "cik": f.cik,
-                "category": f.category,
-                "priority": f.priority,
-            }
-            for f in funds
-        ],
-    )
+    return ORJSONResponse({"total": len(funds), "funds": funds})
 
 
 @router.get("/aggregate/holdings", response_model=FundHoldingsResponse)
 async def get_aggregated_holdings(
     limit: int = Query(default=50, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
-) -> FundHoldingsResponse:
+) -> FundHoldingsResponse | Response:
     """Get aggregated holdings across all active funds.
 
     Returns combined holdings from all funds, aggregated by ticker/company name.
     """
-    # Get all active funds
-    funds_stmt = select(Fund).where(Fund.is_active == True)
-    funds_result = await db.execute(funds_stmt)
-    active_funds = funds_result.scalars().all()
-
-    if not active_funds:
-        return FundHoldingsResponse(
-            fund_id=0,
-            fund_name="ALL FUNDS",
-            filing_date=None,
-            holdings=[],
-            total_value=0,
-        )
-
     # Get latest filing date across all funds
     latest_date_stmt = select(func.max(FundHolding.filing_date))
     result = await db.execute(latest_date_stmt)
@@ -147,58 +205,54 @@ async def get_aggregated_holdings(
             total_value=0,
         )
 
-    # Step 1: Aggregate holdings by CUSIP first (without ticker lookup)
-    aggregated_holdings: dict[str, dict] = {}
-    total_value = 0
-
-    for fund in active_funds:
-        # Get latest filing date for this fund
-        fund_latest_date_stmt = (
-            select(func.max(FundHolding.filing_date))
-            .where(FundHolding.fund_id == fund.id)
+    # Aggregates only change when a new filing lands (new latest date) or the
+    # tracked fund list changes (explicit invalidation), so cache the result.
+    cache_key = fund_aggregate_key("holdings", latest_date.isoformat(), limit)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
+
+    # Step 1+2: Aggregate each active fund's latest filing by CUSIP + company
+    # name in one statement, keeping the top N + buffer for merging after
+    # ticker resolution. The grand total rides along as a window over all groups.
+    latest = _latest_filings_cte()
+    value_sum = func.sum(FundHolding.value)
+    aggregate_stmt = (
+        select(
+            FundHolding.ticker,
+            FundHolding.company_name,
+            func.sum(FundHolding.shares).label("shares"),
+            value_sum.label("value"),
+            func.count().label("fund_count"),
+            func.aggregate_strings(Fund.name, FUND_NAME_SEPARATOR).label("fund_names"),
+            func.sum(value_sum).over().label("total_value"),
         )
-        fund_result = await db.execute(fund_latest_date_stmt)
-        fund_latest_date = fund_result.scalar()
-
-        if not fund_latest_date:
-            continue
-
-        # Get holdings for this fund
-        holdings_stmt = (
-            select(FundHolding)
-            .where(FundHolding.fund_id == fund.id)
-            .where(FundHolding.filing_date == fund_latest_date)
+        .join(
+            latest,
+            (latest.c.fund_id == FundHolding.fund_id)
+            & (latest.c.filing_date == FundHolding.filing_date),
         )
-        holdings_result = await db.execute(holdings_stmt)
-        holdings = holdings_result.scalars().all()
-
-        for h in holdings:
-            # Use CUSIP + company name as aggregation key
-            key = f"{h.ticker}_{h.company_name}"
-
-            if key not in aggregated_holdings:
-                aggregated_holdings[key] = {
-                    "ticker": h.ticker,
-                    "company_name": h.company_name,
-                    "shares": 0,
-                    "value": 0,
-                    "fund_count": 0,
-                    "fund_names": [],
-                }
-            aggregated_holdings[key]["shares"] += h.shares or 0
-            aggregated_holdings[key]["value"] += float(h.value)
-            aggregated_holdings[key]["fund_count"] += 1
-            if fund.name not in aggregated_holdings[key]["fund_names"]:
-                aggregated_holdings[key]["fund_names"].append(fund.name)
-            total_value += float(h.value)
-
-    # Step 2: Sort by value and get top N + buffer for merging
-    # We take more than limit because some might merge after ticker resolution
-    sorted_holdings = sorted(
-        aggregated_holdings.values(),
-        key=lambda x: x["value"],
-        reverse=True
-    )[:limit * 2]  # Take 2x limit as buffer
+        .join(Fund, Fund.id == FundHolding.fund_id)
+        .where(Fund.is_active == True)
+        .group_by(FundHolding.ticker, FundHolding.company_name)
+        .order_by(value_sum.desc())
+        .limit(limit * 2)  # Take 2x limit as buffer
+    )
+    result = await db.execute(aggregate_stmt)
+    rows = result.all()
+
+    total_value = float(rows[0].total_value) if rows else 0
+    sorted_holdings = [
+        {
+            "ticker": row.ticker,
+            "company_name": row.company_name,
+            "shares": int(row.shares or 0),
+            "value": float(row.value),
+            "fund_count": row.fund_count,
+            "fund_names": _split_fund_names(row.fund_names),
+        }
+        for row in rows
+    ]
 
     # Step 3: Batch lookup CUSIPs only for the top holdings
     cusips_to_lookup = list(set(
@@ -232,40 +286,26 @@ async def get_aggregated_holdings(
     # Limit to requested size
     holdings_list = holdings_list[:limit]
 
-    return FundHoldingsResponse(
-        fund_id=0,
-        fund_name="ALL FUNDS",
-        filing_date=latest_date,
-        holdings=holdings_list,
-        total_value=total_value,
-    )
+    payload = {
+        "fund_id": 0,
+        "fund_name": "ALL FUNDS",
+        "filing_date": latest_date.isoformat(),
+        "holdings": holdings_list,
+        "total_value": total_value,
+    }
+    await cache.set(cache_key, payload, CacheService.TTL_MEDIUM)
+    return ORJSONResponse(payload)
 
 
 @router.get("/aggregate/changes", response_model=FundChangesResponse)
 async def get_aggregated_changes(
     db: AsyncSession = Depends(get_db),
-) -> FundChangesResponse:
+) -> FundChangesResponse | Response:
     """Get aggregated changes across all active funds.
 
     Returns combined new positions, increased, decreased, and sold positions
     from all funds, aggregated by ticker.
     """
-    # Get all active funds
-    funds_stmt = select(Fund).where(Fund.is_active == True)
-    funds_result = await db.execute(funds_stmt)
-    active_funds = funds_result.scalars().all()
-
-    if not active_funds:
-        return FundChangesResponse(
-            fund_id=0,
-            fund_name="ALL FUNDS",
-            filing_date=None,
-            new_positions=[],
-            increased=[],
-            decreased=[],
-            sold=[],
-        )
-
     # Get latest filing date across all funds
     latest_date_stmt = select(func.max(FundHolding.filing_date))
     result = await db.execute(latest_date_stmt)
@@ -282,94 +322,78 @@ async def get_aggregated_changes(
             sold=[],
         )
 
-    # Step 1: Aggregate changes by CUSIP first (without ticker lookup)
-    aggregated_changes: dict[str, dict[str, dict]] = {
-        "new": {},
-        "increased": {},
-        "decreased": {},
-        "sold": {}
-    }
-    total_portfolio_value = 0
+    cache_key = fund_aggregate_key("changes", latest_date.isoformat())
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return ORJSONResponse(cached)
 
-    for fund in active_funds:
-        # Get latest filing date for this fund
-        fund_latest_date_stmt = (
-            select(func.max(FundHolding.filing_date))
-            .where(FundHolding.fund_id == fund.id)
-        )
-        fund_result = await db.execute(fund_latest_date_stmt)
-        fund_latest_date = fund_result.scalar()
+    # Step 1+2: Aggregate changes by CUSIP + company name per change type and
+    # keep the top entries of each type by absolute value change, in one query.
+    TOP_CHANGES_LIMIT = 50
+    latest = _latest_filings_cte()
+    on_latest_filing = (
+        (latest.c.fund_id == FundHolding.fund_id)
+        & (latest.c.filing_date == FundHolding.filing_date)
+    )
 
-        if not fund_latest_date:
-            continue
+    # Total value of every active fund's latest filing (for percentages)
+    portfolio_total = (
+        select(func.sum(FundHolding.value))
+        .join(latest, on_latest_filing)
+        .join(Fund, Fund.id == FundHolding.fund_id)
+        .where(Fund.is_active == True)
+        .correlate(None)
+        .scalar_subquery()
+    )
 
-        # Get total value for this fund (for percentage calculations)
-        total_value_stmt = (
-            select(func.sum(FundHolding.value))
-            .where(FundHolding.fund_id == fund.id)
-            .where(FundHolding.filing_date == fund_latest_date)
-        )
-        total_result = await db.execute(total_value_stmt)
-        fund_total_value = total_result.scalar() or 0
-        total_portfolio_value += float(fund_total_value)
-
-        # Get changes for this fund
-        holdings_stmt = (
-            select(FundHolding)
-            .where(FundHolding.fund_id == fund.id)
-            .where(FundHolding.filing_date == fund_latest_date)
-            .where(FundHolding.change_type.isnot(None))
+    value_change_sum = func.sum(_value_change_expr())
+    grouped = (
+        select(
+            FundHolding.change_type,
+            FundHolding.ticker,
+            FundHolding.company_name,
+            func.sum(FundHolding.shares).label("shares"),
+            func.sum(FundHolding.value).label("value"),
+            func.coalesce(func.sum(FundHolding.shares_change), 0).label("shares_change"),
+            value_change_sum.label("value_change"),
+            func.count().label("fund_count"),
+            func.aggregate_strings(Fund.name, FUND_NAME_SEPARATOR).label("fund_names"),
+            portfolio_total.label("total_portfolio_value"),
+            func.row_number()
+            .over(
+                partition_by=FundHolding.change_type,
+                order_by=func.abs(value_change_sum).desc(),
+            )
+            .label("change_rank"),
         )
-        holdings_result = await db.execute(holdings_stmt)
-        holdings = holdings_result.scalars().all()
-
-        for h in holdings:
-            if not h.change_type or h.change_type == "unchanged":
-                continue
-
-            # Calculate value_change
-            if h.change_type == "new":
-                value_change = float(h.value)
-            elif h.change_type == "sold":
-                value_change = -float(h.value)
-            elif h.shares and h.shares_change:
-                value_change = (h.shares_change / h.shares) * float(h.value)
-            else:
-                value_change = 0.0
-
-            # Use CUSIP + company name as aggregation key
-            key = f"{h.ticker}_{h.company_name}"
-            change_dict = aggregated_changes[h.change_type]
-
-            if key not in change_dict:
-                change_dict[key] = {
-                    "ticker": h.ticker,
-                    "company_name": h.company_name,
-                    "shares": 0,
-                    "value": 0,
-                    "shares_change": 0,
-                    "value_change": 0,
-                    "fund_count": 0,
-                    "fund_names": [],
-                }
-
-            change_dict[key]["shares"] += h.shares or 0
-            change_dict[key]["value"] += float(h.value)
-            change_dict[key]["shares_change"] += h.shares_change or 0
-            change_dict[key]["value_change"] += value_change
-            change_dict[key]["fund_count"] += 1
-            if fund.name not in change_dict[key]["fund_names"]:
-                change_dict[key]["fund_names"].append(fund.name)
-
-    # Step 2: Sort each category and get top entries
-    TOP_CHANGES_LIMIT = 50
-    sorted_changes: dict[str, list[dict]] = {}
-    for change_type, changes_dict in aggregated_changes.items():
-        sorted_changes[change_type] = sorted(
-            changes_dict.values(),
-            key=lambda x: abs(x["value_change"]),
-            reverse=True
-        )[:TOP_CHANGES_LIMIT]
+        .join(latest, on_latest_filing)
+        .join(Fund, Fund.id == FundHolding.fund_id)
+        .where(Fund.is_active == True)
+        .where(FundHolding.change_type.in_(CHANGE_TYPES))
+        .group_by(FundHolding.change_type, FundHolding.ticker, FundHolding.company_name)
+        .subquery()
+    )
+    changes_stmt = (
+        select(grouped)
+        .where(grouped.c.change_rank <= TOP_CHANGES_LIMIT)
+        .order_by(grouped.c.change_type, grouped.c.change_rank)
+    )
+    result = await db.execute(changes_stmt)
+    rows = result.all()
+
+    total_portfolio_value = float(rows[0].total_portfolio_value or 0) if rows else 0
+    sorted_changes: dict[str, list[dict]] = {change_type: [] for change_type in CHANGE_TYPES}
+    for row in rows:
+        sorted_changes[row.change_type].append({
+            "ticker": row.ticker,
+            "company_name": row.company_name,
+            "shares": int(row.shares or 0),
+            "value": float(row.value),
+            "shares_change": int(row.shares_change),
+            "value_change": float(row.value_change),
+            "fund_count": row.fund_count,
+            "fund_names": _split_fund_names(row.fund_names),
+        })
 
     # Step 3: Collect unique CUSIPs from top changes only
     cusips_to_lookup = set()
@@ -411,15 +435,17 @@ async def get_aggregated_changes(
                 "fund_names": data["fund_names"],
             })
 
-    return FundChangesResponse(
-        fund_id=0,
-        fund_name="ALL FUNDS",
-        filing_date=latest_date,
-        new_positions=result_changes["new"],
-        increased=result_changes["increased"],
-        decreased=result_changes["decreased"],
-        sold=result_changes["sold"],
-    )
+    payload = {
+        "fund_id": 0,
+        "fund_name": "ALL FUNDS",
+        "filing_date": latest_date.isoformat(),
+        "new_positions": result_changes["new"],
+        "increased": result_changes["increased"],
+        "decreased": result_changes["decreased"],
+        "sold": result_changes["sold"],
+    }
+    await cache.set(cache_key, payload, CacheService.TTL_MEDIUM)
+    return ORJSONResponse(payload)
 
 
 class FundUpdateInfo(BaseModel):
@@ -453,8 +479,6 @@ async def check_fund_updates(
     Returns information about each fund's latest data update, useful for
     showing notifications when new 13F filings have been fetched.
     """
-    from datetime import datetime, timezone
-
     # Parse the 'since' parameter
     since_dt = None
     if since:
@@ -515,20 +539,17 @@ async def check_fund_updates(
 
 @router.get("/{fund_id}/holdings", response_model=FundHoldingsResponse)
 async def get_fund_holdings(
+    request: Request,
     fund_id: Annotated[int, Path(ge=1)],
     limit: int = Query(default=50, ge=1, le=500),
     db: AsyncSession = Depends(get_db),
-) -> FundHoldingsResponse:
+) -> FundHoldingsResponse | Response:
     """Get current holdings for a fund.
 
-    Returns the latest 13F filing holdings sorted by value.
+    Returns the latest 13F filing holdings sorted by value. Responses carry an
+    ETag derived from the latest filing date so polling clients get a 304
+    until a new filing is stored.
     """
-    # Get fund
-    fund = await db.get(Fund, fund_id)
-    if not fund:
-        raise NotFoundException("Fund", str(fund_id))
-
-    # Get latest filing date for this fund
     latest_date_stmt = (
         select(func.max(FundHolding.filing_date))
         .where(FundHolding.fund_id == fund_id)
@@ -537,6 +558,10 @@ async def get_fund_holdings(
     latest_date = result.scalar()
 
     if not latest_date:
+        fund = await db.get(Fund, fund_id)
+        if not fund:
+            raise NotFoundException("Fund", str(fund_id))
+
         return FundHoldingsResponse(
             fund_id=fund_id,
             fund_name=fund.name,
@@ -545,56 +570,63 @@ async def get_fund_holdings(
             total_value=0,
         )
 
-    # Get holdings for latest filing
+    etag = make_etag(fund_id, latest_date.isoformat(), limit)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, HOLDINGS_CACHE_CONTROL)
+
+    # Get the fund name and holdings in one statement: the window sum carries
+    # the filing's total value (computed before LIMIT) on every row
     holdings_stmt = (
-        select(FundHolding)
+        select(
+            *HOLDING_ROW_COLUMNS,
+            cast(func.sum(FundHolding.value).over(), Float).label("total_value"),
+            Fund.name.label("fund_name"),
+        )
+        .join(Fund, Fund.id == FundHolding.fund_id)
         .where(FundHolding.fund_id == fund_id)
         .where(FundHolding.filing_date == latest_date)
         .order_by(FundHolding.value.desc())
         .limit(limit)
     )
     result = await db.execute(holdings_stmt)
-    holdings = result.scalars().all()
+    holdings = result.all()
+    total_value = holdings[0].total_value or 0
 
-    # Calculate total value
-    total_stmt = (
-        select(func.sum(FundHolding.value))
-        .where(FundHolding.fund_id == fund_id)
-        .where(FundHolding.filing_date == latest_date)
-    )
-    result = await db.execute(total_stmt)
-    total_value = result.scalar() or 0
-
-    # Batch lookup CUSIPs
-    cusips_to_lookup = list(set(h.ticker for h in holdings if is_cusip(h.ticker)))
+    # Batch lookup CUSIPs, checking each unique ticker only once
+    unique_tickers = {h.ticker for h in holdings}
+    cusips_to_lookup = [t for t in unique_tickers if is_cusip(t)]
     cusip_to_ticker_map = await lookup_cusips_batch(cusips_to_lookup)
+    resolved_tickers = {t: t for t in unique_tickers}
+    resolved_tickers.update(
+        (cusip, cusip_to_ticker_map.get(cusip)) for cusip in cusips_to_lookup
+    )
 
-    return FundHoldingsResponse(
-        fund_id=fund_id,
-        fund_name=fund.name,
-        filing_date=latest_date,
-        holdings=[
+    return ORJSONResponse({
+        "fund_id": fund_id,
+        "fund_name": holdings[0].fund_name,
+        "filing_date": latest_date,
+        "holdings": [
             {
                 "ticker": h.ticker,
-                "actual_ticker": cusip_to_ticker_map.get(h.ticker) if is_cusip(h.ticker) else h.ticker,
+                "actual_ticker": resolved_tickers[h.ticker],
                 "company_name": h.company_name,
                 "shares": h.shares,
-                "value": float(h.value),
-                "percentage": float(h.percentage) if h.percentage else None,
+                "value": h.value,
+                "percentage": h.percentage,
                 "change_type": h.change_type,
                 "shares_change": h.shares_change,
             }
             for h in holdings
         ],
-        total_value=float(total_value),
-    )
+        "total_value": total_value,
+    }, headers={"ETag": etag, "Cache-Control": HOLDINGS_CACHE_CONTROL})
 
 
 @router.get("/{fund_id}/changes", response_model=FundChangesResponse)
 async def get_fund_changes(
     fund_id: Annotated[int, Path(ge=1)],
     db: AsyncSession = Depends(get_db),
-) -> FundChangesResponse:
+) -> FundChangesResponse | Response:
     """Get recent changes in fund holdings.
 
     Returns new positions, increased positions, decreased positions, and sold positions.
@@ -624,63 +656,54 @@ async def get_fund_changes(
         )
 
     # Get changes by type
-    changes = {"new": [], "increased": [], "decreased": [], "sold": []}
+    changes: dict[str, list[dict]] = {change_type: [] for change_type in CHANGE_TYPES}
 
+    # The changes query has no LIMIT, so stream rows in bounded chunks rather
+    # than materializing the whole result set up front
     holdings_stmt = (
-        select(FundHolding)
+        select(*HOLDING_ROW_COLUMNS, _value_change_expr().label("value_change"))
         .where(FundHolding.fund_id == fund_id)
         .where(FundHolding.filing_date == latest_date)
-        .where(FundHolding.change_type.isnot(None))
+        .where(FundHolding.change_type.in_(CHANGE_TYPES))
         .order_by(FundHolding.value.desc())
+        .execution_options(yield_per=STREAM_CHUNK_SIZE)
     )
-    result = await db.execute(holdings_stmt)
-    holdings = result.scalars().all()
-
-    # Batch lookup CUSIPs
-    cusips_to_lookup = list(set(h.ticker for h in holdings if is_cusip(h.ticker)))
-    cusip_to_ticker_map = await lookup_cusips_batch(cusips_to_lookup)
+    result = await db.stream(holdings_stmt)
 
-    for h in holdings:
-        # Calculate value_change based on change type
-        if h.change_type == "new":
-            value_change = float(h.value)  # Entire position is new
-        elif h.change_type == "sold":
-            value_change = -float(h.value)  # Entire position removed
-        elif h.shares and h.shares_change:
-            # For increased/decreased, calculate proportional value change
-            value_change = (h.shares_change / h.shares) * float(h.value)
-        else:
-            value_change = 0.0
+    cusips_to_lookup: set[str] = set()
+    async for h in result:
+        if is_cusip(h.ticker):
+            cusips_to_lookup.add(h.ticker)
 
-        change_data = {
+        # The query only returns CHANGE_TYPES, so each row has a bucket
+        changes[h.change_type].append({
             "ticker": h.ticker,
-            "actual_ticker": cusip_to_ticker_map.get(h.ticker) if is_cusip(h.ticker) else h.ticker,
+            "actual_ticker": h.ticker,  # CUSIPs are resolved below
             "company_name": h.company_name,
             "shares": h.shares,
-            "value": float(h.value),
+            "value": h.value,
             "shares_change": h.shares_change,
-            "percentage": float(h.percentage) if h.percentage else 0.0,
-            "value_change": value_change,
-        }
+            "percentage": h.percentage or 0.0,
+            "value_change": h.value_change,
+        })
 
-        if h.change_type == "new":
-            changes["new"].append(change_data)
-        elif h.change_type == "increased":
-            changes["increased"].append(change_data)
-        elif h.change_type == "decreased":
-            changes["decreased"].append(change_data)
-        elif h.change_type == "sold":
-            changes["sold"].append(change_data)
-
-    return FundChangesResponse(
-        fund_id=fund_id,
-        fund_name=fund.name,
-        filing_date=latest_date,
-        new_positions=changes["new"],
-        increased=changes["increased"],
-        decreased=changes["decreased"],
-        sold=changes["sold"],
-    )
+    # Batch lookup CUSIPs and patch the resolved tickers in
+    if cusips_to_lookup:
+        cusip_to_ticker_map = await lookup_cusips_batch(list(cusips_to_lookup))
+        for change_list in changes.values():
+            for change_data in change_list:
+                if change_data["ticker"] in cusips_to_lookup:
+                    change_data["actual_ticker"] = cusip_to_ticker_map.get(change_data["ticker"])
+
+    return ORJSONResponse({
+        "fund_id": fund_id,
+        "fund_name": fund.name,
+        "filing_date": latest_date,
+        "new_positions": changes["new"],
+        "increased": changes["increased"],
+        "decreased": changes["decreased"],
+        "sold": changes["sold"],
+    })
 
 
 @router.post("/refresh")
@@ -691,8 +714,6 @@ async def refresh_fund_holdings(
 
     This will queue a job to check for new 13F filings and update holdings.
     """
-    from backend.app.tasks.funds import check_fund_holdings
-
     # Send task to Celery
     task = check_fund_holdings.delay()
 
@@ -714,10 +735,6 @@ async def search_funds(
     Returns matching entities with information about whether they have 13F filings.
     Results from local database are prioritized, followed by results with 13F filings.
     """
-    import structlog
-    from backend.app.services.sec_edgar import get_sec_edgar_client
-
-    logger = structlog.get_logger(__name__)
     results = []
     seen_ciks = set()
 
@@ -730,34 +747,35 @@ async def search_funds(
     # Build search conditions
     if query_padded:
         # If query is all digits, search by CIK
-        local_stmt = select(Fund).where(Fund.cik == query_padded)
+        search_condition = Fund.cik == query_padded
     else:
         # Otherwise search by name, ticker, or CIK substring
-        local_stmt = select(Fund).where(
+        search_condition = (
             (Fund.name.ilike(f"%{query}%")) |
             (Fund.ticker.ilike(f"%{query}%")) |
             (Fund.cik.like(f"%{query}%"))
         )
 
+    # Fetch matching funds together with their latest filing date
+    local_stmt = (
+        select(Fund, func.max(FundHolding.filing_date))
+        .outerjoin(FundHolding, FundHolding.fund_id == Fund.id)
+        .where(search_condition)
+        .group_by(Fund.id)
+    )
+
     local_result = await db.execute(local_stmt)
-    local_funds = local_result.scalars().all()
+    local_matches = local_result.all()
+    local_funds = [fund for fund, _ in local_matches]
 
     logger.info("Local database search completed", query=query, local_funds_count=len(local_funds))
 
     # Add local funds first (highest priority)
-    for fund in local_funds:
+    for fund, latest_date in local_matches:
         if fund.cik in seen_ciks:
             continue
         seen_ciks.add(fund.cik)
 
-        # Get latest filing date if available
-        latest_filing_stmt = (
-            select(func.max(FundHolding.filing_date))
-            .where(FundHolding.fund_id == fund.id)
-        )
-        filing_result = await db.execute(latest_filing_stmt)
-        latest_date = filing_result.scalar()
-
         results.append(
             FundSearchResult(
                 cik=fund.cik,
@@ -773,25 +791,21 @@ async def search_funds(
     client = await get_sec_edgar_client()
     search_results = await client.search_companies(query, limit * 3)
 
-    # Check each SEC result for 13F filings
+    # Check the remaining SEC results for 13F filings in one batch call
+    candidates = []
     for company in search_results:
         # Skip if already added from local database
         if company["cik"] in seen_ciks:
             continue
         seen_ciks.add(company["cik"])
+        candidates.append(company)
 
-        has_filings = False
-        latest_date = None
+    filings_by_cik = await client.get_13f_filings_batch([c["cik"] for c in candidates])
 
-        try:
-            # Quick check for 13F filings
-            filings = await client.get_13f_filings(company["cik"])
-            has_filings = len(filings) > 0
-            if filings:
-                latest_date = filings[0].get("filing_date")
-        except Exception:
-            # If we can't check filings, assume no filings
-            pass
+    for company in candidates:
+        filings = filings_by_cik.get(company["cik"], [])
+        has_filings = len(filings) > 0
+        latest_date = filings[0].get("filing_date") if filings else None
 
         results.append(
             FundSearchResult(
@@ -805,8 +819,9 @@ async def search_funds(
         )
 
     # Sort results: local funds first, then recommended (with 13F filings), then by name
+    local_ciks = {f.cik for f in local_funds}
     results.sort(key=lambda x: (
-        x.cik not in [f.cik for f in local_funds],  # Local funds first
+        x.cik not in local_ciks,  # Local funds first
         not x.is_recommended,  # Then recommended
         x.name  # Then alphabetically
     ))
@@ -863,10 +878,9 @@ async def add_fund(
         if not existing_fund.is_active:
             existing_fund.is_active = True
             await db.commit()
+            await cache.invalidate_pattern(FUND_AGGREGATE_PATTERN)
 
             # Trigger automatic holdings fetch for the reactivated fund
-            from backend.app.tasks.funds import refresh_single_fund
-
             refresh_single_fund.delay(existing_fund.id)
 
             return AddFundResponse(
@@ -903,10 +917,9 @@ async def add_fund(
     db.add(new_fund)
     await db.commit()
     await db.refresh(new_fund)
+    await cache.invalidate_pattern(FUND_AGGREGATE_PATTERN)
 
     # Trigger automatic holdings fetch for the new fund
-    from backend.app.tasks.funds import refresh_single_fund
-
     refresh_single_fund.delay(new_fund.id)
 
     return AddFundResponse(
@@ -936,6 +949,7 @@ async def remove_fund(
     # Deactivate the fund
     fund.is_active = False
     await db.commit()
+    await cache.invalidate_pattern(FUND_AGGREGATE_PATTERN)
 
     return {
         "status": "success",
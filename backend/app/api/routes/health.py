@@ -1,19 +1,126 @@
 """Health check API routes for data sources."""
 
 import asyncio
-from datetime import datetime
-from typing import Any
+import importlib.util
+import math
+import random
+import time
+from collections import defaultdict
+from collections.abc import Awaitable, Callable
+from dataclasses import dataclass
+from datetime import datetime, timezone
+from typing import Any, Literal
 
-from fastapi import APIRouter
+from fastapi import APIRouter, Query, Request, Response
 import structlog
 import httpx
-from sqlalchemy import text
+import orjson
+from sqlalchemy import func, select
 
+from backend.app.celery_app import celery_app
 from backend.app.config import settings
+from backend.app.core.circuit_breaker import CircuitBreaker
+from backend.app.core.http_cache import conditional_response
+from backend.app.core.responses import ORJSONResponse
+from backend.app.db.models import ScrapedWebsite
+from backend.app.db.session import async_session_factory, engine
+from backend.app.services.cache import LocalTTLCache, cache, get_redis_client
 
 logger = structlog.get_logger(__name__)
 router = APIRouter()
 
+# Shared HTTP client for health probes; keeps connections alive between checks
+_http_client: httpx.AsyncClient | None = None
+
+# How often (seconds) the Alpha Vantage health check spends a quota-counted
+# quote request to validate the API key; plain reachability is checked with a
+# keyless HEAD on every probe
+ALPHA_VANTAGE_KEY_CHECK_TTL = 3600
+_alpha_vantage_key_status = LocalTTLCache(ttl=ALPHA_VANTAGE_KEY_CHECK_TTL)
+
+# Seconds to wait for Celery workers to answer the ping broadcast
+CELERY_PING_TIMEOUT = 1.0
+
+# Seconds the NordVPN check may take, both per request and as its overall budget
+NORDVPN_TIMEOUT = 5.0
+
+# Client-side cache policy for health overview responses
+HEALTH_CACHE_CONTROL = "private, max-age=30"
+
+# HTTP/2 lets concurrent probes to the same origin share one connection;
+# only enabled when the optional h2 package (httpx[http2]) is installed
+HTTP2_ENABLED = importlib.util.find_spec("h2") is not None
+
+# External origins probed by the health checks, warmed up at startup
+HEALTH_PROBE_ORIGINS = (
+    "https://www.alphavantage.co",
+    "https://query1.finance.yahoo.com",
+    "https://data.sec.gov",
+    "https://api.openfigi.com",
+    "https://api.nordvpn.com",
+)
+
+# Probe requests, built once at import so each check only sends them
+_OLLAMA_TAGS_URL = httpx.URL("http://172.18.0.1:11434/api/tags")
+_ALPHA_VANTAGE_ROOT_URL = httpx.URL("https://www.alphavantage.co/")
+_ALPHA_VANTAGE_QUOTE_URL = httpx.URL(
+    "https://www.alphavantage.co/query",
+    params={"function": "GLOBAL_QUOTE", "symbol": "AAPL"},
+)
+_YAHOO_CHART_URL = httpx.URL(
+    "https://query1.finance.yahoo.com/v8/finance/chart/AAPL",
+    params={"interval": "1d", "range": "1d"},
+)
+# Yahoo Finance requires a browser-like User-Agent header
+_YAHOO_HEADERS = {
+    "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
+}
+_SEC_SUBMISSIONS_URL = httpx.URL("https://data.sec.gov/submissions/CIK0001067983.json")
+# Only the status matters, so ask for a single byte of the submissions JSON
+_SEC_HEADERS = {
+    "User-Agent": "StockInfo Research Tool contact@example.com",
+    "Range": "bytes=0-0",
+}
+_OPENFIGI_MAPPING_URL = httpx.URL("https://api.openfigi.com/v3/mapping")
+_OPENFIGI_HEADERS = {"Content-Type": "application/json"}
+_OPENFIGI_BODY = orjson.dumps([{"idType": "ID_CUSIP", "idValue": "037833100"}])
+_NORDVPN_INSIGHTS_URL = httpx.URL("https://api.nordvpn.com/v1/helpers/ips/insights")
+
+
+def get_health_http_client() -> httpx.AsyncClient:
+    """Get or create the pooled HTTP client used by health checks."""
+    global _http_client
+
+    if _http_client is None or _http_client.is_closed:
+        _http_client = httpx.AsyncClient(
+            http2=HTTP2_ENABLED,
+            timeout=5.0,
+            limits=httpx.Limits(max_connections=20, max_keepalive_connections=10),
+        )
+    return _http_client
+
+
+async def prewarm_health_http_client() -> None:
+    """Open pooled connections to the probed origins ahead of the first check."""
+    client = get_health_http_client()
+
+    async def warm(origin: str) -> None:
+        try:
+            await client.head(origin)
+        except httpx.HTTPError as e:
+            logger.debug("Health client prewarm failed", origin=origin, error=str(e))
+
+    await asyncio.gather(*(warm(origin) for origin in HEALTH_PROBE_ORIGINS))
+
+
+async def close_health_http_client() -> None:
+    """Close the shared health check HTTP client."""
+    global _http_client
+
+    if _http_client is not None:
+        await _http_client.aclose()
+        _http_client = None
+
 
 # Data source configurations with descriptions and tab mappings
 DATA_SOURCE_INFO = {
@@ -101,13 +208,29 @@ TAB_DATA_MAPPINGS = {
 }
 
 
+def _build_source_to_tabs() -> dict[str, list[dict[str, Any]]]:
+    """Index tab data types by their primary source."""
+    source_to_tabs: dict[str, list[dict[str, Any]]] = defaultdict(list)
+    for tab_name, tab_info in TAB_DATA_MAPPINGS.items():
+        for data_type in tab_info["data_types"]:
+            source_to_tabs[data_type["primary"]].append({
+                "tab": tab_name,
+                "data_type": data_type["name"],
+                "fallback": data_type.get("fallback"),
+            })
+    return dict(source_to_tabs)
+
+
+# Inverse of TAB_DATA_MAPPINGS, built once at import
+SOURCE_TO_TABS = _build_source_to_tabs()
+
+
 async def check_database() -> dict[str, Any]:
     """Check database connectivity."""
     try:
-        from backend.app.db.session import async_session_factory
-
-        async with async_session_factory() as session:
-            await session.execute(text("SELECT 1"))
+        # Ping on a bare pooled connection; no session or ORM setup needed
+        async with engine.connect() as conn:
+            await conn.exec_driver_sql("SELECT 1")
 
         return {
             "name": "PostgreSQL Database",
@@ -123,26 +246,25 @@ async def check_database() -> dict[str, Any]:
 
 
 async def check_redis() -> dict[str, Any]:
-    """Check Redis connectivity."""
-    try:
-        from backend.app.celery_app import celery_app
-
-        # Try to ping Redis through Celery
-        inspector = celery_app.control.inspect()
-        stats = inspector.stats()
+    """Check Redis connectivity with a direct PING.
 
-        if stats:
-            return {
-                "name": "Redis Cache",
-                "status": "healthy",
-                "message": "Connected successfully",
-            }
-        else:
+    Worker availability is reported separately by check_celery.
+    """
+    try:
+        client = await get_redis_client()
+        if client is None:
             return {
                 "name": "Redis Cache",
-                "status": "degraded",
-                "message": "Connected but no workers available",
+                "status": "unhealthy",
+                "message": "Connection failed",
             }
+
+        await client.ping()
+        return {
+            "name": "Redis Cache",
+            "status": "healthy",
+            "message": "Connected successfully",
+        }
     except Exception as e:
         return {
             "name": "Redis Cache",
@@ -154,13 +276,14 @@ async def check_redis() -> dict[str, Any]:
 async def check_celery() -> dict[str, Any]:
     """Check Celery worker status."""
     try:
-        from backend.app.celery_app import celery_app
-
-        inspector = celery_app.control.inspect()
-        active = inspector.active()
+        # ping() is the cheapest inspect broadcast, but it is still a blocking
+        # broker round-trip; run it in a worker thread so it cannot stall the
+        # event loop and the check timeout can fire
+        inspector = celery_app.control.inspect(timeout=CELERY_PING_TIMEOUT)
+        replies = await asyncio.to_thread(inspector.ping)
 
-        if active:
-            worker_count = len(active)
+        if replies:
+            worker_count = len(replies)
             return {
                 "name": "Celery Workers",
                 "status": "healthy",
@@ -184,38 +307,38 @@ async def check_celery() -> dict[str, Any]:
 async def check_ollama() -> dict[str, Any]:
     """Check Ollama LLM service."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Check if Ollama is running - use gateway IP since backend runs through VPN
-            response = await client.get("http://172.18.0.1:11434/api/tags")
-
-            if response.status_code == 200:
-                data = response.json()
-                models = data.get("models", [])
-
-                # Check if required model is available
-                model_name = "llama3.2"  # From config
-                has_model = any(model.get("name", "").startswith(model_name) for model in models)
-
-                if has_model:
-                    return {
-                        "name": "Ollama LLM",
-                        "status": "healthy",
-                        "message": f"Service running with {len(models)} model(s)",
-                        "models": [m.get("name") for m in models],
-                    }
-                else:
-                    return {
-                        "name": "Ollama LLM",
-                        "status": "degraded",
-                        "message": f"Service running but model '{model_name}' not found",
-                        "models": [m.get("name") for m in models],
-                    }
+        client = get_health_http_client()
+        # Check if Ollama is running - use gateway IP since backend runs through VPN
+        response = await client.get(_OLLAMA_TAGS_URL)
+
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            names = [model.get("name", "") for model in data.get("models", [])]
+
+            # Check if required model is available
+            model_name = "llama3.2"  # From config
+            has_model = any(name.startswith(model_name) for name in names)
+
+            if has_model:
+                return {
+                    "name": "Ollama LLM",
+                    "status": "healthy",
+                    "message": f"Service running with {len(names)} model(s)",
+                    "models": names,
+                }
             else:
                 return {
                     "name": "Ollama LLM",
-                    "status": "unhealthy",
-                    "message": f"HTTP {response.status_code}",
+                    "status": "degraded",
+                    "message": f"Service running but model '{model_name}' not found",
+                    "models": names,
                 }
+        else:
+            return {
+                "name": "Ollama LLM",
+                "status": "unhealthy",
+                "message": f"HTTP {response.status_code}",
+            }
     except httpx.TimeoutException:
         return {
             "name": "Ollama LLM",
@@ -230,8 +353,61 @@ async def check_ollama() -> dict[str, Any]:
         }
 
 
+async def _check_alpha_vantage_key(client: httpx.AsyncClient) -> dict[str, Any]:
+    """Validate the Alpha Vantage API key and quota with a real quote request."""
+    # Simple API test - get AAPL quote
+    response = await client.get(
+        _ALPHA_VANTAGE_QUOTE_URL.copy_merge_params(
+            {"apikey": settings.alpha_vantage_api_key}
+        )
+    )
+
+    if response.status_code != 200:
+        return {
+            "name": "Alpha Vantage API",
+            "status": "unhealthy",
+            "message": f"HTTP {response.status_code}",
+        }
+
+    data = orjson.loads(response.content)
+
+    # Check for rate limit or error
+    if "Note" in data:
+        result = {
+            "name": "Alpha Vantage API",
+            "status": "degraded",
+            "message": "Rate limit reached",
+        }
+    elif "Error Message" in data:
+        result = {
+            "name": "Alpha Vantage API",
+            "status": "unhealthy",
+            "message": data["Error Message"],
+        }
+    elif "Global Quote" in data:
+        result = {
+            "name": "Alpha Vantage API",
+            "status": "healthy",
+            "message": "API responding correctly",
+        }
+    else:
+        result = {
+            "name": "Alpha Vantage API",
+            "status": "degraded",
+            "message": "Unexpected response format",
+        }
+
+    _alpha_vantage_key_status.set("default", result)
+    return result
+
+
 async def check_alpha_vantage() -> dict[str, Any]:
-    """Check Alpha Vantage API."""
+    """Check Alpha Vantage API.
+
+    Reachability is checked with a keyless HEAD on every probe; the quote
+    request that validates the key (and counts against the daily quota) runs
+    at most once per ALPHA_VANTAGE_KEY_CHECK_TTL.
+    """
     if not settings.alpha_vantage_api_key:
         return {
             "name": "Alpha Vantage API",
@@ -240,51 +416,19 @@ async def check_alpha_vantage() -> dict[str, Any]:
         }
 
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Simple API test - get AAPL quote
-            response = await client.get(
-                "https://www.alphavantage.co/query",
-                params={
-                    "function": "GLOBAL_QUOTE",
-                    "symbol": "AAPL",
-                    "apikey": settings.alpha_vantage_api_key,
-                },
-            )
+        client = get_health_http_client()
+        response = await client.head(_ALPHA_VANTAGE_ROOT_URL)
+        if response.status_code >= 400:
+            return {
+                "name": "Alpha Vantage API",
+                "status": "unhealthy",
+                "message": f"HTTP {response.status_code}",
+            }
 
-            if response.status_code == 200:
-                data = response.json()
-
-                # Check for rate limit or error
-                if "Note" in data:
-                    return {
-                        "name": "Alpha Vantage API",
-                        "status": "degraded",
-                        "message": "Rate limit reached",
-                    }
-                elif "Error Message" in data:
-                    return {
-                        "name": "Alpha Vantage API",
-                        "status": "unhealthy",
-                        "message": data["Error Message"],
-                    }
-                elif "Global Quote" in data:
-                    return {
-                        "name": "Alpha Vantage API",
-                        "status": "healthy",
-                        "message": "API responding correctly",
-                    }
-                else:
-                    return {
-                        "name": "Alpha Vantage API",
-                        "status": "degraded",
-                        "message": "Unexpected response format",
-                    }
-            else:
-                return {
-                    "name": "Alpha Vantage API",
-                    "status": "unhealthy",
-                    "message": f"HTTP {response.status_code}",
-                }
+        key_status = _alpha_vantage_key_status.get()
+        if key_status is None:
+            key_status = await _check_alpha_vantage_key(client)
+        return key_status
     except httpx.TimeoutException:
         return {
             "name": "Alpha Vantage API",
@@ -302,29 +446,22 @@ async def check_alpha_vantage() -> dict[str, Any]:
 async def check_yahoo_finance() -> dict[str, Any]:
     """Check Yahoo Finance API."""
     try:
-        # Yahoo Finance requires a browser-like User-Agent header
-        headers = {
-            "User-Agent": "Mozilla/5.0 (Windows NT 10.0; Win64; x64) AppleWebKit/537.36 (KHTML, like Gecko) Chrome/120.0.0.0 Safari/537.36"
-        }
-        async with httpx.AsyncClient(timeout=5.0, headers=headers) as client:
-            # Test endpoint
-            response = await client.get(
-                "https://query1.finance.yahoo.com/v8/finance/chart/AAPL",
-                params={"interval": "1d", "range": "1d"},
-            )
+        client = get_health_http_client()
+        # Test endpoint; only the status matters, so skip the body with HEAD
+        response = await client.head(_YAHOO_CHART_URL, headers=_YAHOO_HEADERS)
 
-            if response.status_code == 200:
-                return {
-                    "name": "Yahoo Finance API",
-                    "status": "healthy",
-                    "message": "API responding correctly",
-                }
-            else:
-                return {
-                    "name": "Yahoo Finance API",
-                    "status": "unhealthy",
-                    "message": f"HTTP {response.status_code}",
-                }
+        if response.status_code == 200:
+            return {
+                "name": "Yahoo Finance API",
+                "status": "healthy",
+                "message": "API responding correctly",
+            }
+        else:
+            return {
+                "name": "Yahoo Finance API",
+                "status": "unhealthy",
+                "message": f"HTTP {response.status_code}",
+            }
     except httpx.TimeoutException:
         return {
             "name": "Yahoo Finance API",
@@ -342,31 +479,28 @@ async def check_yahoo_finance() -> dict[str, Any]:
 async def check_sec_edgar() -> dict[str, Any]:
     """Check SEC EDGAR API."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Test endpoint - get a sample CIK
-            response = await client.get(
-                "https://data.sec.gov/submissions/CIK0001067983.json",
-                headers={"User-Agent": "StockInfo Research Tool contact@example.com"},
-            )
+        client = get_health_http_client()
+        # Test endpoint - get a sample CIK
+        response = await client.get(_SEC_SUBMISSIONS_URL, headers=_SEC_HEADERS)
 
-            if response.status_code == 200:
-                return {
-                    "name": "SEC EDGAR API",
-                    "status": "healthy",
-                    "message": "API responding correctly",
-                }
-            elif response.status_code == 429:
-                return {
-                    "name": "SEC EDGAR API",
-                    "status": "degraded",
-                    "message": "Rate limit reached",
-                }
-            else:
-                return {
-                    "name": "SEC EDGAR API",
-                    "status": "degraded",
-                    "message": f"HTTP {response.status_code}",
-                }
+        if response.status_code in (200, 206):
+            return {
+                "name": "SEC EDGAR API",
+                "status": "healthy",
+                "message": "API responding correctly",
+            }
+        elif response.status_code == 429:
+            return {
+                "name": "SEC EDGAR API",
+                "status": "degraded",
+                "message": "Rate limit reached",
+            }
+        else:
+            return {
+                "name": "SEC EDGAR API",
+                "status": "degraded",
+                "message": f"HTTP {response.status_code}",
+            }
     except httpx.TimeoutException:
         return {
             "name": "SEC EDGAR API",
@@ -384,40 +518,40 @@ async def check_sec_edgar() -> dict[str, Any]:
 async def check_openfigi() -> dict[str, Any]:
     """Check OpenFIGI API."""
     try:
-        async with httpx.AsyncClient(timeout=5.0) as client:
-            # Test with a known CUSIP (Apple)
-            response = await client.post(
-                "https://api.openfigi.com/v3/mapping",
-                headers={"Content-Type": "application/json"},
-                json=[{"idType": "ID_CUSIP", "idValue": "037833100"}],
-            )
+        client = get_health_http_client()
+        # Test with a known CUSIP (Apple)
+        response = await client.post(
+            _OPENFIGI_MAPPING_URL,
+            headers=_OPENFIGI_HEADERS,
+            content=_OPENFIGI_BODY,
+        )
 
-            if response.status_code == 200:
-                data = response.json()
-                if data and len(data) > 0 and "data" in data[0]:
-                    return {
-                        "name": "OpenFIGI API",
-                        "status": "healthy",
-                        "message": "API responding correctly",
-                    }
-                else:
-                    return {
-                        "name": "OpenFIGI API",
-                        "status": "degraded",
-                        "message": "Unexpected response format",
-                    }
-            elif response.status_code == 429:
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            if data and len(data) > 0 and "data" in data[0]:
                 return {
                     "name": "OpenFIGI API",
-                    "status": "degraded",
-                    "message": "Rate limit reached",
+                    "status": "healthy",
+                    "message": "API responding correctly",
                 }
             else:
                 return {
                     "name": "OpenFIGI API",
-                    "status": "unhealthy",
-                    "message": f"HTTP {response.status_code}",
+                    "status": "degraded",
+                    "message": "Unexpected response format",
                 }
+        elif response.status_code == 429:
+            return {
+                "name": "OpenFIGI API",
+                "status": "degraded",
+                "message": "Rate limit reached",
+            }
+        else:
+            return {
+                "name": "OpenFIGI API",
+                "status": "unhealthy",
+                "message": f"HTTP {response.status_code}",
+            }
     except httpx.TimeoutException:
         return {
             "name": "OpenFIGI API",
@@ -432,17 +566,18 @@ async def check_openfigi() -> dict[str, Any]:
         }
 
 
+# Count of active scraped websites (served by idx_scraped_website_active)
+_ACTIVE_WEBSITES_COUNT_STMT = (
+    select(func.count()).select_from(ScrapedWebsite).where(ScrapedWebsite.is_active == True)
+)
+
+
 async def check_web_scraping() -> dict[str, Any]:
     """Check web scraping capability (Playwright/browser availability)."""
     try:
         # Check if there are any configured scraped websites
-        from backend.app.db.session import async_session_factory
-        from backend.app.db.models import ScrapedWebsite
-        from sqlalchemy import select, func
-
         async with async_session_factory() as session:
-            stmt = select(func.count()).select_from(ScrapedWebsite).where(ScrapedWebsite.is_active == True)
-            result = await session.execute(stmt)
+            result = await session.execute(_ACTIVE_WEBSITES_COUNT_STMT)
             active_count = result.scalar() or 0
 
         if active_count > 0:
@@ -470,44 +605,42 @@ async def check_web_scraping() -> dict[str, Any]:
 async def check_nordvpn() -> dict[str, Any]:
     """Check NordVPN connection status."""
     try:
-        async with httpx.AsyncClient(timeout=10.0) as client:
-            # Check NordVPN API for connection status
-            response = await client.get(
-                "https://api.nordvpn.com/v1/helpers/ips/insights"
-            )
+        client = get_health_http_client()
+        # Check NordVPN API for connection status
+        response = await client.get(_NORDVPN_INSIGHTS_URL, timeout=NORDVPN_TIMEOUT)
+
+        if response.status_code == 200:
+            data = orjson.loads(response.content)
+            is_protected = data.get("protected", False)
+            country = data.get("country", "Unknown")
+            city = data.get("city", "Unknown")
 
-            if response.status_code == 200:
-                data = response.json()
-                is_protected = data.get("protected", False)
-                country = data.get("country", "Unknown")
-                city = data.get("city", "Unknown")
-
-                if is_protected:
-                    return {
-                        "name": "NordVPN",
-                        "status": "healthy",
-                        "message": f"Connected via {city}, {country}",
-                        "protected": True,
-                        "location": f"{city}, {country}",
-                    }
-                else:
-                    return {
-                        "name": "NordVPN",
-                        "status": "unhealthy",
-                        "message": "VPN not active - traffic not protected",
-                        "protected": False,
-                    }
+            if is_protected:
+                return {
+                    "name": "NordVPN",
+                    "status": "healthy",
+                    "message": f"Connected via {city}, {country}",
+                    "protected": True,
+                    "location": f"{city}, {country}",
+                }
             else:
                 return {
                     "name": "NordVPN",
                     "status": "unhealthy",
-                    "message": f"HTTP {response.status_code}",
+                    "message": "VPN not active - traffic not protected",
+                    "protected": False,
                 }
+        else:
+            return {
+                "name": "NordVPN",
+                "status": "unhealthy",
+                "message": f"HTTP {response.status_code}",
+            }
     except httpx.TimeoutException:
         return {
             "name": "NordVPN",
             "status": "unhealthy",
-            "message": "Request timeout (10s)",
+            "message": f"Request timeout ({NORDVPN_TIMEOUT:g}s)",
         }
     except Exception as e:
         return {
@@ -517,8 +650,257 @@ async def check_nordvpn() -> dict[str, Any]:
         }
 
 
+@dataclass(frozen=True)
+class HealthCheck:
+    """A registered health check and its caching/timeout budget."""
+
+    probe: Callable[[], Awaitable[dict[str, Any]]]
+    label: str
+    # How long (seconds) a result is reused before probing again
+    ttl: int
+    # Max seconds the probe may take before it is reported as timed out
+    timeout: float
+    # How long (seconds) a last known good result may stand in for a failed
+    # probe; 0 reports failures immediately
+    stale_grace: int = 0
+    # Upper bound (seconds) for backing off re-probes of a source that keeps
+    # failing; 0 re-probes every TTL
+    max_backoff: int = 0
+
+
+# Registry of health checks by source id. Local infrastructure is cheap to
+# re-check; external APIs have rate limits and get longer TTLs, and ride out
+# transient failures on their last known good result and back off while down.
+HEALTH_CHECKS = {
+    "database": HealthCheck(check_database, "PostgreSQL Database", ttl=5, timeout=2.0),
+    "redis": HealthCheck(check_redis, "Redis Cache", ttl=5, timeout=1.0),
+    "celery": HealthCheck(check_celery, "Celery Workers", ttl=15, timeout=3.0),
+    "nordvpn": HealthCheck(check_nordvpn, "NordVPN", ttl=120, timeout=NORDVPN_TIMEOUT, max_backoff=600),
+    "ollama": HealthCheck(check_ollama, "Ollama LLM", ttl=30, timeout=3.0, max_backoff=600),
+    "alpha_vantage": HealthCheck(check_alpha_vantage, "Alpha Vantage API", ttl=60, timeout=3.0, stale_grace=300, max_backoff=600),
+    "yahoo_finance": HealthCheck(check_yahoo_finance, "Yahoo Finance API", ttl=60, timeout=3.0, stale_grace=300, max_backoff=600),
+    "sec_edgar": HealthCheck(check_sec_edgar, "SEC EDGAR API", ttl=60, timeout=3.0, stale_grace=300, max_backoff=600),
+    "openfigi": HealthCheck(check_openfigi, "OpenFIGI API", ttl=60, timeout=3.0, stale_grace=300, max_backoff=600),
+    "web_scraping": HealthCheck(check_web_scraping, "Web Scraping", ttl=60, timeout=2.0),
+}
+
+
+# Circuit breakers for external sources; open ones skip the network call.
+# They stay open for the longest backoff so that an open circuit outlasts
+# the gap between probes and actually skips one.
+_breakers = {
+    name: CircuitBreaker(name, open_timeout=health_check.max_backoff)
+    for name, health_check in HEALTH_CHECKS.items()
+    if health_check.max_backoff
+}
+
+# Probes currently running, by check name
+_inflight: dict[str, asyncio.Task] = {}
+
+
+async def single_flight(
+    name: str, probe: Callable[[], Awaitable[dict[str, Any]]]
+) -> dict[str, Any]:
+    """Run probe once for all concurrent callers asking for the same check.
+
+    Callers arriving while a probe for name is in flight await that probe's
+    result instead of starting another one. The shared task is shielded so a
+    cancelled caller does not cancel it for the others.
+    """
+    task = _inflight.get(name)
+    if task is None:
+        task = asyncio.ensure_future(probe())
+        _inflight[name] = task
+        task.add_done_callback(lambda _: _inflight.pop(name, None))
+    return await asyncio.shield(task)
+
+
+def utc_timestamp() -> str:
+    """Current UTC time as an ISO 8601 string with a Z suffix."""
+    return datetime.now(timezone.utc).isoformat(timespec="seconds").replace("+00:00", "Z")
+
+
+def health_check_key(name: str) -> str:
+    """Build cache key for a health check result."""
+    return f"health:{name}"
+
+
+def backoff_ttl(health_check: HealthCheck, failures: int) -> int:
+    """Cache TTL for a result after the given number of consecutive failures.
+
+    Doubles the check's TTL per failure up to its max_backoff, with jitter so
+    API processes sharing the cache do not re-probe a downed source in step.
+    """
+    delay = min(health_check.ttl * 2**failures, health_check.max_backoff)
+    return max(health_check.ttl, int(delay * random.uniform(0.5, 1.0)))
+
+
+def health_backoff_key(name: str) -> str:
+    """Build cache key for a failing health check's backoff state."""
+    return f"health:backoff:{name}"
+
+
+def health_last_good_key(name: str) -> str:
+    """Build cache key for a health check's last healthy result."""
+    return f"health:last_good:{name}"
+
+
+async def cached_check(name: str, fresh: bool = False) -> dict[str, Any]:
+    """Run a health check, reusing its cached result within the source TTL.
+
+    Args:
+        name: Source id from HEALTH_CHECKS
+        fresh: Skip the cache and always probe
+
+    Returns:
+        Check result
+    """
+    if not fresh:
+        cached = await cache.get(health_check_key(name))
+        if cached is not None:
+            return cached
+
+    return await single_flight(name, lambda: run_check(name))
+
+
+async def run_check(name: str, ttl: int | None = None) -> dict[str, Any]:
+    """Probe a source within its timeout budget and cache the result.
+
+    Probes exceeding their timeout budget report unhealthy instead of holding
+    up the whole health response. External sources sit behind a circuit
+    breaker that skips the probe entirely while open. Sources that keep
+    failing are not probed again for exponentially longer (see backoff_ttl):
+    the failure count and next attempt time live in Redis, so the API
+    processes and the periodic worker task all serve the recorded failure
+    until then instead of hammering a downed API. For checks with a stale
+    grace period, a failed probe is reported as the last healthy result
+    marked ``stale`` until that result is older than the grace period.
+
+    Args:
+        name: Source id from HEALTH_CHECKS
+        ttl: Cache TTL override in seconds (defaults to the check's TTL)
+
+    Returns:
+        Check result
+    """
+    health_check = HEALTH_CHECKS[name]
+    base_ttl = ttl = ttl or health_check.ttl
+
+    backoff = None
+    if health_check.max_backoff:
+        backoff = await cache.get(health_backoff_key(name))
+        if backoff is not None:
+            remaining = backoff["next_attempt"] - time.time()
+            if remaining > 0:
+                # Still backing off: serve the recorded failure, no network call
+                result = backoff["result"]
+                await cache.set(health_check_key(name), result, math.ceil(remaining))
+                return result
+
+    breaker = _breakers.get(name)
+    probed = breaker is None or breaker.allow_request()
+    if not probed:
+        result = {
+            "name": health_check.label,
+            "status": "unhealthy",
+            "message": "Circuit open; probe skipped",
+        }
+    else:
+        try:
+            result = await asyncio.wait_for(health_check.probe(), health_check.timeout)
+        except asyncio.TimeoutError:
+            result = {
+                "name": health_check.label,
+                "status": "unhealthy",
+                "message": f"Check timeout ({health_check.timeout:g}s)",
+            }
+        if breaker is not None:
+            if result["status"] == "unhealthy":
+                breaker.record_failure()
+            else:
+                breaker.record_success()
+
+    failures = 0
+    # Skipped probes say nothing new about the source, so leave its backoff alone
+    if health_check.max_backoff and probed:
+        if result["status"] != "unhealthy":
+            if backoff is not None:
+                await cache.delete(health_backoff_key(name))
+        else:
+            failures = (backoff["failures"] if backoff else 0) + 1
+
+    if health_check.stale_grace:
+        if result["status"] == "healthy":
+            await cache.set(health_last_good_key(name), result, health_check.stale_grace)
+        else:
+            last_good = await cache.get(health_last_good_key(name))
+            if last_good is not None:
+                # Keep re-probing at the normal rate while inside the grace
+                # period so recovery or expiry is noticed promptly
+                ttl = base_ttl
+                result = {
+                    **last_good,
+                    "stale": True,
+                    "message": f"Serving last known good result; latest check: {result.get('message', result['status'])}",
+                }
+
+    if failures:
+        # Back off unless a stale result is being served, which keeps the
+        # normal re-probe rate; the state outlives the window so the failure
+        # count keeps growing across consecutive windows
+        if result.get("stale"):
+            delay = base_ttl
+        else:
+            delay = max(base_ttl, backoff_ttl(health_check, failures))
+        ttl = delay
+        await cache.set(
+            health_backoff_key(name),
+            {
+                "failures": failures,
+                "next_attempt": time.time() + delay,
+                "result": result,
+            },
+            delay + health_check.max_backoff,
+        )
+
+    await cache.set(health_check_key(name), result, ttl)
+    return result
+
+
+# Checks an instance needs to serve requests at all, and the remaining
+# services reported by /health (order matches the response categories)
+CORE_HEALTH_CHECKS = ("database", "redis")
+SERVICE_HEALTH_CHECKS = (
+    "celery",
+    "nordvpn",
+    "ollama",
+    "alpha_vantage",
+    "yahoo_finance",
+    "sec_edgar",
+)
+
+
+def _probe_response(results: list[dict[str, Any]]) -> ORJSONResponse:
+    """Build a liveness/readiness response; 503 when any check is unhealthy."""
+    healthy = all(r["status"] != "unhealthy" for r in results)
+    return ORJSONResponse(
+        {
+            "status": "healthy" if healthy else "unhealthy",
+            "timestamp": utc_timestamp(),
+            "checks": results,
+        },
+        status_code=200 if healthy else 503,
+    )
+
+
 @router.get("/health")
-async def health_check() -> dict[str, Any]:
+async def health_check(
+    fresh: bool = Query(default=False, description="Bypass cached check results"),
+    mode: Literal["liveness", "readiness"] | None = Query(
+        default=None,
+        description="liveness: core checks only; readiness: skip external checks when core is down",
+    ),
+) -> ORJSONResponse:
     """
     Comprehensive health check for all data sources and services.
 
@@ -528,20 +910,42 @@ async def health_check() -> dict[str, Any]:
     - Workers (Celery)
     - LLM (Ollama)
     - External APIs (Alpha Vantage, Yahoo Finance, SEC EDGAR)
+
+    For orchestrator probes, ``mode=liveness`` runs only the database and
+    Redis checks, and ``mode=readiness`` returns 503 without probing the
+    external services when either of those is unhealthy.
     """
-    logger.info("Running health check")
+    logger.info("Running health check", mode=mode)
 
-    # Run all checks concurrently
-    results = await asyncio.gather(
-        check_database(),
-        check_redis(),
-        check_celery(),
-        check_nordvpn(),
-        check_ollama(),
-        check_alpha_vantage(),
-        check_yahoo_finance(),
-        check_sec_edgar(),
-    )
+    if mode == "liveness":
+        results = await asyncio.gather(
+            *(cached_check(name, fresh) for name in CORE_HEALTH_CHECKS)
+        )
+        return _probe_response(results)
+
+    if mode == "readiness":
+        async with asyncio.TaskGroup() as tg:
+            core_tasks = [
+                tg.create_task(cached_check(name, fresh)) for name in CORE_HEALTH_CHECKS
+            ]
+        core_results = [task.result() for task in core_tasks]
+        if any(r["status"] == "unhealthy" for r in core_results):
+            # Not ready without the database and cache; skip the other probes
+            return _probe_response(core_results)
+
+        async with asyncio.TaskGroup() as tg:
+            service_tasks = [
+                tg.create_task(cached_check(name, fresh)) for name in SERVICE_HEALTH_CHECKS
+            ]
+        results = core_results + [task.result() for task in service_tasks]
+    else:
+        # Run all checks concurrently
+        results = await asyncio.gather(
+            *(
+                cached_check(name, fresh)
+                for name in (*CORE_HEALTH_CHECKS, *SERVICE_HEALTH_CHECKS)
+            )
+        )
 
     # Categorize results
     infrastructure = results[0:4]  # Database, Redis, Celery, NordVPN
@@ -557,20 +961,23 @@ async def health_check() -> dict[str, Any]:
     else:
         overall_status = "degraded"
 
-    return {
+    return ORJSONResponse({
         "status": overall_status,
-        "timestamp": datetime.utcnow().isoformat() + "Z",
+        "timestamp": utc_timestamp(),
         "services": {
             "infrastructure": infrastructure,
             "ai_services": ai_services,
             "external_apis": external_apis,
         },
         "checks": results,
-    }
+    })
 
 
 @router.get("/health/data-sources")
-async def data_sources_overview() -> dict[str, Any]:
+async def data_sources_overview(
+    request: Request,
+    fresh: bool = Query(default=False, description="Bypass cached check results"),
+) -> Response:
     """
     Get data sources overview for the Overview tab.
 
@@ -578,21 +985,23 @@ async def data_sources_overview() -> dict[str, Any]:
     - Status of all data sources with descriptions
     - Tab-to-source mappings with fallback information
     - Timestamp of when the check was performed
+
+    Responses carry a content ETag; a matching If-None-Match gets a 304.
     """
     logger.info("Running data sources overview check")
 
     # Run all source checks concurrently
     results = await asyncio.gather(
-        check_database(),
-        check_redis(),
-        check_celery(),
-        check_nordvpn(),
-        check_ollama(),
-        check_alpha_vantage(),
-        check_yahoo_finance(),
-        check_sec_edgar(),
-        check_openfigi(),
-        check_web_scraping(),
+        cached_check("database", fresh),
+        cached_check("redis", fresh),
+        cached_check("celery", fresh),
+        cached_check("nordvpn", fresh),
+        cached_check("ollama", fresh),
+        cached_check("alpha_vantage", fresh),
+        cached_check("yahoo_finance", fresh),
+        cached_check("sec_edgar", fresh),
+        cached_check("openfigi", fresh),
+        cached_check("web_scraping", fresh),
     )
 
     # Map results to source names
@@ -626,17 +1035,15 @@ async def data_sources_overview() -> dict[str, Any]:
         if source_data["status"] == "unhealthy":
             # Find which tabs are affected
             affected_tabs = []
-            for tab_name, tab_info in TAB_DATA_MAPPINGS.items():
-                for data_type in tab_info["data_types"]:
-                    if data_type["primary"] == source_id:
-                        fallback = data_type.get("fallback")
-                        has_fallback = fallback and sources.get(fallback, {}).get("status") == "healthy"
-                        affected_tabs.append({
-                            "tab": tab_name,
-                            "data_type": data_type["name"],
-                            "fallback": fallback,
-                            "fallback_available": has_fallback,
-                        })
+            for usage in SOURCE_TO_TABS.get(source_id, ()):
+                fallback = usage["fallback"]
+                has_fallback = fallback and sources.get(fallback, {}).get("status") == "healthy"
+                affected_tabs.append({
+                    "tab": usage["tab"],
+                    "data_type": usage["data_type"],
+                    "fallback": fallback,
+                    "fallback_available": has_fallback,
+                })
 
             if affected_tabs:
                 warnings.append({
@@ -646,9 +1053,10 @@ async def data_sources_overview() -> dict[str, Any]:
                     "affected": affected_tabs,
                 })
 
-    return {
+    response = ORJSONResponse({
         "sources": sources,
         "tabs": TAB_DATA_MAPPINGS,
         "warnings": warnings,
-        "checked_at": datetime.utcnow().isoformat() + "Z",
-    }
+        "checked_at": utc_timestamp(),
+    })
+    return conditional_response(request, response, HEALTH_CACHE_CONTROL)
@@ -1,27 +1,196 @@
 """Market sentiment API routes."""
 
-from datetime import date, timedelta
-
-from fastapi import APIRouter, Depends, Query
-from sqlalchemy import select
+import asyncio
+import re
+from collections import deque
+from datetime import date, datetime, time, timedelta, timezone
+from operator import itemgetter
+from typing import Any
+from uuid import uuid4
+
+import structlog
+from fastapi import APIRouter, Depends, Query, Request, Response
+from sqlalchemy import Float, bindparam, cast, func, select, true
+from sqlalchemy.dialects.postgresql import insert
 from sqlalchemy.ext.asyncio import AsyncSession
-
-from backend.app.db.models import MarketSentiment, WebScrapedMarketData
+from sqlalchemy.orm import aliased
+
+from backend.app.config import get_settings
+from backend.app.core.http_cache import conditional_response
+from backend.app.core.responses import ORJSONResponse
+from backend.app.db.models import (
+    MarketSentiment,
+    ScrapedCategoryData,
+    ScrapedWebsite,
+    UserConfig,
+    WebScrapedMarketData,
+)
 from backend.app.db.session import get_db
+from backend.app.services.cache import (
+    CacheService,
+    LocalTTLCache,
+    cache,
+    market_scraping_config_cache,
+    market_sentiment_view_key,
+    refresh_lock_key,
+)
+from backend.app.services.yahoo_finance import get_yahoo_finance_client
+from backend.app.tasks.market import (
+    refresh_market_sentiment as refresh_market_sentiment_task,
+    refresh_web_scraped_market as refresh_web_scraped_market_task,
+)
+from backend.app.schemas.config import DATA_USE_CATEGORIES, DATA_USE_DISPLAY_NAMES
 from backend.app.schemas.market import (
-    MarketSentimentResponse,
     MarketSentimentHistoryResponse,
-    WebScrapedMarketDataResponse,
     CombinedMarketResponse,
 )
 
 router = APIRouter()
+logger = structlog.get_logger(__name__)
+
+# Market data changes at most once per market minute; let browsers and
+# proxies reuse responses for that long
+MARKET_CACHE_CONTROL = "public, max-age=60"
+
+# Assembled /indices/history payloads by (period, UTC date), shared across
+# requests; daily closes only move intraday, so 15 minutes of reuse is enough
+INDICES_HISTORY_TTL = 900
+_indices_history_cache = LocalTTLCache(ttl=INDICES_HISTORY_TTL)
+
+# NYSE regular session in UTC (09:30-16:00 ET during daylight saving time)
+MARKET_OPEN_UTC = time(13, 30)
+MARKET_CLOSE_UTC = time(20, 0)
+
+# Redis TTL for sentiment responses while the market is open
+SENTIMENT_TTL_MARKET_HOURS = 900
+
+# Hot statements, built once and executed with bound parameters so requests
+# skip statement construction and hit the compiled-statement cache.
+
+# Latest MarketSentiment and WebScrapedMarketData rows side by side. The
+# FULL JOIN keeps a row when only one table has data (either side may be None).
+_latest_sentiment = (
+    select(MarketSentiment).order_by(MarketSentiment.date.desc()).limit(1).subquery()
+)
+_latest_web_data = (
+    select(WebScrapedMarketData).order_by(WebScrapedMarketData.date.desc()).limit(1).subquery()
+)
+_LATEST_MARKET_DATA_STMT = (
+    select(
+        aliased(MarketSentiment, _latest_sentiment),
+        aliased(WebScrapedMarketData, _latest_web_data),
+    )
+    .select_from(_latest_sentiment)
+    .join(_latest_web_data, true(), full=True)
+)
+
+# Charted history columns only, cast to floats in SQL so rows need no
+# per-value Decimal conversion (and the JSON news/sector blobs stay unread)
+_SENTIMENT_HISTORY_STMT = (
+    select(
+        MarketSentiment.date,
+        cast(MarketSentiment.sp500_change_pct, Float).label("sp500_change_pct"),
+        cast(MarketSentiment.nasdaq_change_pct, Float).label("nasdaq_change_pct"),
+        cast(MarketSentiment.dow_change_pct, Float).label("dow_change_pct"),
+        cast(MarketSentiment.overall_sentiment, Float).label("overall_sentiment"),
+    )
+    .where(MarketSentiment.date >= bindparam("start_date"))
+    .order_by(MarketSentiment.date.desc())
+    .limit(bindparam("row_limit"))
+)
+
+# Latest Alpha Vantage news; only the news blob is needed, not the other JSON columns
+_LATEST_NEWS_STMT = (
+    select(MarketSentiment.date, MarketSentiment.top_news)
+    .order_by(MarketSentiment.date.desc())
+    .limit(1)
+)
+
+# How long an enqueued refresh suppresses identical enqueues (roughly the
+# expected task runtime)
+REFRESH_LOCK_TTL = 300
+
+
+# Field-name variants used by scraped stock sources, in lookup order
+_TICKER_KEYS = ("ticker", "symbol", "TICKER", "Symbol")
+_NAME_KEYS = ("name", "company_name", "Name", "company")
+_PRICE_KEYS = ("price", "Price", "current_price")
+_CHANGE_PCT_KEYS = ("change_pct", "change_percent", "pct_change", "percent_change")
+_PRICE_CHANGE_KEYS = ("price_change", "change")
+_CHANGE_ABS_KEYS = ("change_abs", "change_absolute", "price_change_abs")
+_VOLUME_KEYS = ("volume", "Volume")
+_REASON_KEYS = ("reason", "description")
+
+# Percentage inside strings like "+1.15 (+13.39%)"
+_PCT_RE = re.compile(r"([+-]?\d+\.?\d*)%")
+
+# Characters stripped before parsing scraped numbers
+_STRIP_CURRENCY = str.maketrans("", "", "$,")
+_STRIP_PERCENT = str.maketrans("", "", "%+")
+_STRIP_SIGNED_CURRENCY = str.maketrans("", "", "$,+")
+
+# Volume suffix multipliers, checked in this order
+_VOLUME_SUFFIXES = (("M", 1_000_000), ("K", 1_000), ("B", 1_000_000_000))
+
+# Traditional API source keys (everything else is a web-scraped source)
+_API_SOURCES = frozenset({
+    "alpha_vantage_news",
+    "alpha_vantage_sentiment",
+    "yahoo_finance_gainers",
+    "yahoo_finance_losers",
+})
+
+# Categories that contain stock data and should be normalized
+_STOCK_CATEGORIES = frozenset({"top_gainers", "top_losers", "hot_stocks"})
+
+# Keys holding the item list in scraped category data, in priority order
+_SCRAPED_DATA_KEYS = ("stocks", "sectors", "ratings", "articles", "holdings", "changes")
+
+# Sort key for normalized stock items
+_BY_CHANGE_PCT = itemgetter("change_pct")
+
+# Sentinel for an exhausted iterator when interleaving news sources
+_EXHAUSTED = object()
+
+
+def _optional_float(value: Any) -> float | None:
+    """Convert a numeric column value to float, mapping empty/zero to None."""
+    return float(value) if value else None
+
+
+async def _enqueue_once(lock_key: str, task: Any, **kwargs: Any) -> str:
+    """Queue a Celery task unless the same refresh was queued recently.
+
+    The first caller claims ``lock_key`` in Redis for REFRESH_LOCK_TTL seconds
+    and publishes the task (off the event loop); concurrent callers get the
+    id of the already-queued task instead of enqueuing a duplicate.
+    """
+    task_id = str(uuid4())
+    if not await cache.claim(lock_key, task_id, REFRESH_LOCK_TTL):
+        queued_id = await cache.get(lock_key)
+        if queued_id:
+            return queued_id
+    await asyncio.to_thread(task.apply_async, kwargs=kwargs, task_id=task_id)
+    return task_id
+
+
+def _sentiment_cache_ttl() -> int:
+    """Redis TTL for sentiment responses: short in market hours, a day otherwise.
+
+    Refresh tasks invalidate the cached responses when new data is saved, so
+    the long off-hours TTL does not hide fresh data.
+    """
+    now = datetime.now(timezone.utc)
+    if now.weekday() < 5 and MARKET_OPEN_UTC <= now.time() < MARKET_CLOSE_UTC:
+        return SENTIMENT_TTL_MARKET_HOURS
+    return CacheService.TTL_LONG
 
 
 @router.get("/sentiment", response_model=CombinedMarketResponse)
 async def get_market_sentiment(
+    request: Request,
     db: AsyncSession = Depends(get_db),
-) -> CombinedMarketResponse:
+) -> CombinedMarketResponse | Response:
     """Get current market sentiment analysis.
 
     Returns both traditional and web-scraped market data including:
@@ -29,11 +198,16 @@ async def get_market_sentiment(
     - Web-scraped: Market summary, sentiment, sectors, themes from configured website
 
     Auto-triggers a refresh if no data exists or if data has all zero values (placeholder).
+    Responses carry a content ETag; a matching If-None-Match gets a 304.
     """
-    # Get the latest traditional sentiment
-    stmt = select(MarketSentiment).order_by(MarketSentiment.date.desc()).limit(1)
-    result = await db.execute(stmt)
-    sentiment = result.scalar_one_or_none()
+    cache_key = market_sentiment_view_key("latest", date.today().isoformat())
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return conditional_response(request, ORJSONResponse(cached), MARKET_CACHE_CONTROL)
+
+    # Latest traditional sentiment and web-scraped data in one round-trip
+    result = await db.execute(_LATEST_MARKET_DATA_STMT)
+    sentiment, web_data = result.one_or_none() or (None, None)
 
     # Auto-trigger refresh if:
     # 1. No data exists
@@ -46,100 +220,106 @@ async def get_market_sentiment(
     )
 
     if should_refresh:
-        from backend.app.tasks.market import refresh_market_sentiment as refresh_task
-        refresh_task.delay()
+        # Concurrent dashboard loads share one queued refresh
+        await _enqueue_once(refresh_lock_key("market_sentiment"), refresh_market_sentiment_task)
         # Note: This will be async, so first load may show stale data, but subsequent loads will have fresh data
 
+    # Payloads are assembled as plain dicts in the shape of
+    # CombinedMarketResponse and serialized directly, skipping model
+    # construction and validation
     if not sentiment:
-        traditional_response = MarketSentimentResponse(
-            date=date.today(),
-            message="No sentiment data available. Run market analysis first.",
-        )
+        traditional = {
+            "date": date.today(),
+            "indices": None,
+            "overall_sentiment": None,
+            "bullish_score": None,
+            "bearish_score": None,
+            "hot_sectors": [],
+            "negative_sectors": [],
+            "top_news": [],
+            "message": "No sentiment data available. Run market analysis first.",
+        }
     else:
-        traditional_response = MarketSentimentResponse(
-            date=sentiment.date,
-            indices={
+        traditional = {
+            "date": sentiment.date,
+            "indices": {
                 "sp500": {
-                    "close": float(sentiment.sp500_close) if sentiment.sp500_close else None,
-                    "change_pct": float(sentiment.sp500_change_pct) if sentiment.sp500_change_pct else None,
+                    "close": _optional_float(sentiment.sp500_close),
+                    "change_pct": _optional_float(sentiment.sp500_change_pct),
                 },
                 "nasdaq": {
-                    "close": float(sentiment.nasdaq_close) if sentiment.nasdaq_close else None,
-                    "change_pct": float(sentiment.nasdaq_change_pct) if sentiment.nasdaq_change_pct else None,
+                    "close": _optional_float(sentiment.nasdaq_close),
+                    "change_pct": _optional_float(sentiment.nasdaq_change_pct),
                 },
                 "dow": {
-                    "close": float(sentiment.dow_close) if sentiment.dow_close else None,
-                    "change_pct": float(sentiment.dow_change_pct) if sentiment.dow_change_pct else None,
+                    "close": _optional_float(sentiment.dow_close),
+                    "change_pct": _optional_float(sentiment.dow_change_pct),
                 },
             },
-            overall_sentiment=float(sentiment.overall_sentiment) if sentiment.overall_sentiment else None,
-            bullish_score=float(sentiment.bullish_score) if sentiment.bullish_score else None,
-            bearish_score=float(sentiment.bearish_score) if sentiment.bearish_score else None,
-            hot_sectors=sentiment.hot_sectors or [],
-            negative_sectors=sentiment.negative_sectors or [],
-            top_news=sentiment.top_news or [],
-        )
-
-    # Get web-scraped data
-    stmt = select(WebScrapedMarketData).order_by(WebScrapedMarketData.date.desc()).limit(1)
-    result = await db.execute(stmt)
-    web_data = result.scalar_one_or_none()
+            "overall_sentiment": _optional_float(sentiment.overall_sentiment),
+            "bullish_score": _optional_float(sentiment.bullish_score),
+            "bearish_score": _optional_float(sentiment.bearish_score),
+            "hot_sectors": sentiment.hot_sectors or [],
+            "negative_sectors": sentiment.negative_sectors or [],
+            "top_news": sentiment.top_news or [],
+            "message": None,
+        }
 
-    web_scraped_response = None
+    web_scraped = None
     if web_data:
-        web_scraped_response = WebScrapedMarketDataResponse(
-            date=web_data.date,
-            source_url=web_data.source_url,
-            source_name=web_data.source_name,
-            market_summary=web_data.market_summary,
-            overall_sentiment=float(web_data.overall_sentiment) if web_data.overall_sentiment else None,
-            bullish_score=float(web_data.bullish_score) if web_data.bullish_score else None,
-            bearish_score=float(web_data.bearish_score) if web_data.bearish_score else None,
-            trending_sectors=web_data.trending_sectors or [],
-            declining_sectors=web_data.declining_sectors or [],
-            market_themes=web_data.market_themes or [],
-            key_events=web_data.key_events or [],
-            confidence_score=float(web_data.confidence_score) if web_data.confidence_score else None,
-            scraping_model=web_data.scraping_model,
-            analysis_model=web_data.analysis_model,
-        )
+        web_scraped = {
+            "date": web_data.date,
+            "source_url": web_data.source_url,
+            "source_name": web_data.source_name,
+            "market_summary": web_data.market_summary,
+            "overall_sentiment": _optional_float(web_data.overall_sentiment),
+            "bullish_score": _optional_float(web_data.bullish_score),
+            "bearish_score": _optional_float(web_data.bearish_score),
+            "trending_sectors": web_data.trending_sectors or [],
+            "declining_sectors": web_data.declining_sectors or [],
+            "market_themes": web_data.market_themes or [],
+            "key_events": web_data.key_events or [],
+            "confidence_score": _optional_float(web_data.confidence_score),
+            "scraping_model": web_data.scraping_model,
+            "analysis_model": web_data.analysis_model,
+        }
 
-    return CombinedMarketResponse(
-        traditional=traditional_response,
-        web_scraped=web_scraped_response,
-    )
+    payload = {"traditional": traditional, "web_scraped": web_scraped}
+    # Only cache settled data; a queued refresh will replace it shortly
+    if not should_refresh:
+        await cache.set(cache_key, payload, _sentiment_cache_ttl())
+
+    return conditional_response(request, ORJSONResponse(payload), MARKET_CACHE_CONTROL)
 
 
 @router.get("/sentiment/history", response_model=MarketSentimentHistoryResponse)
 async def get_market_sentiment_history(
+    request: Request,
     days: int = Query(default=7, ge=1, le=30),
     db: AsyncSession = Depends(get_db),
-) -> MarketSentimentHistoryResponse:
-    """Get market sentiment history for the specified number of days."""
-    start_date = date.today() - timedelta(days=days)
+) -> MarketSentimentHistoryResponse | Response:
+    """Get market sentiment history for the specified number of days.
 
-    stmt = (
-        select(MarketSentiment)
-        .where(MarketSentiment.date >= start_date)
-        .order_by(MarketSentiment.date.desc())
-    )
-    result = await db.execute(stmt)
-    sentiments = result.scalars().all()
-
-    history = []
-    for s in sentiments:
-        history.append({
-            "date": s.date,
-            "sp500_change_pct": float(s.sp500_change_pct) if s.sp500_change_pct else None,
-            "nasdaq_change_pct": float(s.nasdaq_change_pct) if s.nasdaq_change_pct else None,
-            "dow_change_pct": float(s.dow_change_pct) if s.dow_change_pct else None,
-            "overall_sentiment": float(s.overall_sentiment) if s.overall_sentiment else None,
-        })
+    Responses carry a content ETag; a matching If-None-Match gets a 304.
+    """
+    today = date.today()
+    cache_key = market_sentiment_view_key("history", today.isoformat(), days)
+    cached = await cache.get(cache_key)
+    if cached is not None:
+        return conditional_response(request, ORJSONResponse(cached), MARKET_CACHE_CONTROL)
+
+    start_date = today - timedelta(days=days)
 
-    return MarketSentimentHistoryResponse(
-        days=days,
-        history=history,
+    result = await db.execute(
+        _SENTIMENT_HISTORY_STMT,
+        # One row per day; the window includes start_date
+        {"start_date": start_date, "row_limit": days + 1},
     )
+    history = [dict(row) for row in result.mappings()]
+
+    payload = {"days": days, "history": history}
+    await cache.set(cache_key, payload, _sentiment_cache_ttl())
+    return conditional_response(request, ORJSONResponse(payload), MARKET_CACHE_CONTROL)
 
 
 @router.post("/sentiment/refresh")
@@ -149,16 +329,16 @@ async def refresh_market_sentiment(
     """Trigger a refresh of market sentiment analysis.
 
     This will queue a job to fetch latest market data and run sentiment analysis.
+    If a refresh is already queued (manually or by the dashboard's
+    auto-refresh), its job id is returned instead of queuing another.
     """
-    from backend.app.tasks.market import refresh_market_sentiment as refresh_task
-
     # Send task to Celery
-    task = refresh_task.delay()
+    job_id = await _enqueue_once(refresh_lock_key("market_sentiment"), refresh_market_sentiment_task)
 
     return {
         "status": "queued",
         "message": "Market sentiment refresh has been queued",
-        "job_id": task.id,
+        "job_id": job_id,
     }
 
 
@@ -175,10 +355,11 @@ async def refresh_web_scraped_market_data(
         scraping_model: Optional LLM model for scraping (defaults to user config)
         analysis_model: Optional LLM model for analysis (defaults to user config)
     """
-    from backend.app.tasks.market import refresh_web_scraped_market as refresh_task
-
-    # Send task to Celery
-    task = refresh_task.delay(
+    # Send task to Celery; repeated clicks for the same configuration reuse
+    # the refresh that is already queued
+    job_id = await _enqueue_once(
+        refresh_lock_key("web_scraped_market", website_key, scraping_model, analysis_model),
+        refresh_web_scraped_market_task,
         website_config_key=website_key,
         scraping_model=scraping_model,
         analysis_model=analysis_model,
@@ -187,7 +368,7 @@ async def refresh_web_scraped_market_data(
     return {
         "status": "queued",
         "message": "Web-scraped market data refresh has been queued",
-        "job_id": task.id,
+        "job_id": job_id,
     }
 
 
@@ -200,8 +381,9 @@ async def get_market_scraping_config(
     Returns websites from both config.yaml and user-configured custom websites
     from the database.
     """
-    from backend.app.config import get_settings
-    from backend.app.db.models import ScrapedWebsite
+    cached = market_scraping_config_cache.get()
+    if cached is not None:
+        return cached
 
     settings = get_settings()
     configs = settings.web_scraping_configs
@@ -233,9 +415,11 @@ async def get_market_scraping_config(
             "description": website.description,
         }
 
-    return {
+    payload = {
         "available_websites": market_configs,
     }
+    market_scraping_config_cache.set("default", payload)
+    return payload
 
 
 @router.post("/scraping-config")
@@ -246,59 +430,34 @@ async def set_market_scraping_config(
     db: AsyncSession = Depends(get_db),
 ) -> dict:
     """Save user's market scraping configuration."""
-    from backend.app.db.models import UserConfig
-
-    # Save website selection
-    stmt = select(UserConfig).where(UserConfig.config_key == "market_scraping_website")
-    result = await db.execute(stmt)
-    config = result.scalar_one_or_none()
-
-    if config:
-        config.config_value = {"website_key": website_key}
-    else:
-        config = UserConfig(
-            config_key="market_scraping_website",
-            config_value={"website_key": website_key},
-            description="Selected website for market data scraping",
-        )
-        db.add(config)
-
-    # Save scraping model if provided
+    # Website selection always, models only when provided
+    rows = [
+        {
+            "config_key": "market_scraping_website",
+            "config_value": {"website_key": website_key},
+            "description": "Selected website for market data scraping",
+        }
+    ]
     if scraping_model:
-        stmt = select(UserConfig).where(
-            UserConfig.config_key == "market_scraping_llm_model"
-        )
-        result = await db.execute(stmt)
-        config = result.scalar_one_or_none()
-
-        if config:
-            config.config_value = {"model": scraping_model}
-        else:
-            config = UserConfig(
-                config_key="market_scraping_llm_model",
-                config_value={"model": scraping_model},
-                description="LLM model for market data scraping",
-            )
-            db.add(config)
-
-    # Save analysis model if provided
+        rows.append({
+            "config_key": "market_scraping_llm_model",
+            "config_value": {"model": scraping_model},
+            "description": "LLM model for market data scraping",
+        })
     if analysis_model:
-        stmt = select(UserConfig).where(
-            UserConfig.config_key == "market_analysis_llm_model"
-        )
-        result = await db.execute(stmt)
-        config = result.scalar_one_or_none()
-
-        if config:
-            config.config_value = {"model": analysis_model}
-        else:
-            config = UserConfig(
-                config_key="market_analysis_llm_model",
-                config_value={"model": analysis_model},
-                description="LLM model for market analysis",
-            )
-            db.add(config)
+        rows.append({
+            "config_key": "market_analysis_llm_model",
+            "config_value": {"model": analysis_model},
+            "description": "LLM model for market analysis",
+        })
 
+    # Upsert every key in a single statement
+    stmt = insert(UserConfig).values(rows)
+    stmt = stmt.on_conflict_do_update(
+        index_elements=["config_key"],
+        set_={"config_value": stmt.excluded.config_value, "updated_at": func.now()},
+    )
+    await db.execute(stmt)
     await db.commit()
 
     return {
@@ -314,16 +473,15 @@ async def set_market_scraping_config(
 
 @router.get("/indices/history")
 async def get_indices_history(
+    request: Request,
     days: int = Query(default=90, ge=1, le=365),
-) -> dict:
+) -> Response:
     """Get historical data for major market indices.
 
     Returns the last N days of price data for S&P 500, NASDAQ, and Dow Jones.
+    Payloads are reused per period and UTC date for 15 minutes, and
+    responses carry a content ETag so unchanged polls get a 304.
     """
-    from backend.app.services.yahoo_finance import get_yahoo_finance_client
-
-    client = get_yahoo_finance_client()
-
     # Map days to period parameter
     if days <= 5:
         period = "5d"
@@ -336,33 +494,62 @@ async def get_indices_history(
     else:
         period = "1y"
 
+    # Key on the UTC date too so a new trading day never serves yesterday's window
+    cache_key = f"{period}:{datetime.now(timezone.utc).date().isoformat()}"
+    result = _indices_history_cache.get(cache_key)
+    if result is None:
+        result = await _fetch_indices_history(period)
+        # Don't pin a failed fetch; retry it on the next request
+        if all(result.values()):
+            _indices_history_cache.set(cache_key, result)
+
+    return conditional_response(request, ORJSONResponse(result), MARKET_CACHE_CONTROL)
+
+
+async def _fetch_indices_history(period: str) -> dict[str, list[dict]]:
+    """Fetch daily closes for the major indices over the given period."""
+    client = get_yahoo_finance_client()
+
     indices = {
         "^GSPC": "sp500",
         "^IXIC": "nasdaq",
         "^DJI": "dow",
     }
 
+    # Fetch all indices concurrently; a failed symbol yields an empty series
+    histories = await asyncio.gather(
+        *(
+            client.get_historical_prices(symbol, period=period, interval="1d")
+            for symbol in indices
+        ),
+        return_exceptions=True,
+    )
+
     result = {}
-    for symbol, key in indices.items():
-        try:
-            history = await client.get_historical_prices(
-                symbol,
-                period=period,
-                interval="1d",
-            )
-            result[key] = [
-                {
-                    "date": point["date"],
-                    "close": float(point["close"]) if point["close"] else None,
-                }
-                for point in history
-            ]
-        except Exception as e:
+    for key, history in zip(indices.values(), histories):
+        if isinstance(history, Exception):
             result[key] = []
+            continue
+        result[key] = [
+            {
+                "date": point["date"],
+                "close": float(point["close"]) if point["close"] else None,
+            }
+            for point in history
+        ]
 
     return result
 
 
+def _first(item: dict, keys: tuple[str, ...]) -> Any:
+    """Return the first truthy value among ``keys`` in ``item``, else None."""
+    for key in keys:
+        value = item.get(key)
+        if value:
+            return value
+    return None
+
+
 def _normalize_stock_data(item: dict, category: str) -> dict:
     """
     Normalize scraped stock data to a consistent format.
@@ -370,35 +557,33 @@ def _normalize_stock_data(item: dict, category: str) -> dict:
     Different sources may return data with different field names.
     This function maps common variations to expected field names.
     """
-    import re
-
     normalized = {}
 
     # Map ticker/symbol fields
-    normalized["ticker"] = item.get("ticker") or item.get("symbol") or item.get("TICKER") or item.get("Symbol") or "N/A"
+    normalized["ticker"] = _first(item, _TICKER_KEYS) or "N/A"
 
     # Map name fields
-    normalized["name"] = item.get("name") or item.get("company_name") or item.get("Name") or item.get("company") or normalized["ticker"]
+    normalized["name"] = _first(item, _NAME_KEYS) or normalized["ticker"]
 
     # Map price fields
-    price = item.get("price") or item.get("Price") or item.get("current_price")
+    price = _first(item, _PRICE_KEYS)
     if price is not None:
         try:
-            normalized["price"] = float(str(price).replace("$", "").replace(",", ""))
+            normalized["price"] = float(str(price).translate(_STRIP_CURRENCY))
         except (ValueError, TypeError):
             normalized["price"] = None
     else:
         normalized["price"] = None
 
     # Map change percentage - handle various formats
-    change_pct = item.get("change_pct") or item.get("change_percent") or item.get("pct_change") or item.get("percent_change")
+    change_pct = _first(item, _CHANGE_PCT_KEYS)
 
     # If change_pct not found directly, try to parse from combined string like "+1.15 (+13.39%)"
     if change_pct is None:
-        price_change = item.get("price_change") or item.get("change") or ""
+        price_change = _first(item, _PRICE_CHANGE_KEYS) or ""
         if isinstance(price_change, str) and "%" in price_change:
             # Extract percentage from string like "+1.15 (+13.39%)" or "-5.2%"
-            match = re.search(r'([+-]?\d+\.?\d*)%', price_change)
+            match = _PCT_RE.search(price_change)
             if match:
                 try:
                     change_pct = float(match.group(1))
@@ -407,34 +592,32 @@ def _normalize_stock_data(item: dict, category: str) -> dict:
 
     if change_pct is not None:
         try:
-            normalized["change_pct"] = float(str(change_pct).replace("%", "").replace("+", ""))
+            normalized["change_pct"] = float(str(change_pct).translate(_STRIP_PERCENT))
         except (ValueError, TypeError):
             normalized["change_pct"] = 0.0
     else:
         normalized["change_pct"] = 0.0
 
     # Map absolute change
-    change_abs = item.get("change_abs") or item.get("change_absolute") or item.get("price_change_abs")
+    change_abs = _first(item, _CHANGE_ABS_KEYS)
     if change_abs is not None:
         try:
-            normalized["change_abs"] = float(str(change_abs).replace("$", "").replace(",", "").replace("+", ""))
+            normalized["change_abs"] = float(str(change_abs).translate(_STRIP_SIGNED_CURRENCY))
         except (ValueError, TypeError):
             normalized["change_abs"] = None
     else:
         normalized["change_abs"] = None
 
     # Map volume
-    volume = item.get("volume") or item.get("Volume")
+    volume = _first(item, _VOLUME_KEYS)
     if volume is not None:
         try:
             # Handle volume strings like "1.2M" or "500K"
             vol_str = str(volume).upper().replace(",", "")
-            if "M" in vol_str:
-                normalized["volume"] = int(float(vol_str.replace("M", "")) * 1_000_000)
-            elif "K" in vol_str:
-                normalized["volume"] = int(float(vol_str.replace("K", "")) * 1_000)
-            elif "B" in vol_str:
-                normalized["volume"] = int(float(vol_str.replace("B", "")) * 1_000_000_000)
+            for suffix, multiplier in _VOLUME_SUFFIXES:
+                if suffix in vol_str:
+                    normalized["volume"] = int(float(vol_str.replace(suffix, "")) * multiplier)
+                    break
             else:
                 normalized["volume"] = int(float(vol_str))
         except (ValueError, TypeError):
@@ -444,7 +627,7 @@ def _normalize_stock_data(item: dict, category: str) -> dict:
 
     # Copy any additional fields for hot_stocks category
     if category == "hot_stocks":
-        normalized["reason"] = item.get("reason") or item.get("description") or None
+        normalized["reason"] = _first(item, _REASON_KEYS)
         normalized["sentiment"] = item.get("sentiment") or None
 
     return normalized
@@ -459,8 +642,6 @@ async def _get_yahoo_finance_top_movers(category: str) -> tuple[list, dict | Non
     Returns:
         Tuple of (data list, source info dict or None if failed)
     """
-    from backend.app.services.yahoo_finance import get_yahoo_finance_client
-
     try:
         client = get_yahoo_finance_client()
         if category == "top_gainers":
@@ -472,13 +653,11 @@ async def _get_yahoo_finance_top_movers(category: str) -> tuple[list, dict | Non
             source_info = {
                 "source_key": f"yahoo_finance_{category.replace('top_', '')}",
                 "source_url": "https://finance.yahoo.com/",
-                "date": date.today().isoformat(),
+                "date": date.today(),
                 "scraping_model": None,
             }
             return data, source_info
     except Exception as e:
-        import structlog
-        logger = structlog.get_logger(__name__)
         logger.warning(f"Failed to fetch Yahoo Finance {category}", error=str(e))
 
     return [], None
@@ -490,15 +669,14 @@ async def _get_alpha_vantage_news(db) -> tuple[list, dict | None]:
     Returns:
         Tuple of (news list, source info dict or None if no data)
     """
-    stmt = select(MarketSentiment).order_by(MarketSentiment.date.desc()).limit(1)
-    result = await db.execute(stmt)
-    sentiment = result.scalar_one_or_none()
+    result = await db.execute(_LATEST_NEWS_STMT)
+    sentiment = result.one_or_none()
 
     if sentiment and sentiment.top_news:
         source_info = {
             "source_key": "alpha_vantage_news",
             "source_url": "https://www.alphavantage.co/",
-            "date": sentiment.date.isoformat(),
+            "date": sentiment.date,
             "scraping_model": None,
         }
         return sentiment.top_news, source_info
@@ -511,7 +689,7 @@ async def get_scraped_category_data(
     category: str,
     days: int = Query(default=1, ge=1, le=30, description="Number of days to look back"),
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> Response:
     """Get scraped data for a specific category.
 
     This retrieves category-specific data (e.g., top_gainers, top_losers, hot_stocks)
@@ -530,17 +708,6 @@ async def get_scraped_category_data(
     Returns:
         Combined data from configured sources for the specified category
     """
-    from backend.app.db.models import ScrapedCategoryData, UserConfig
-    from backend.app.schemas.config import DATA_USE_CATEGORIES, DATA_USE_DISPLAY_NAMES
-
-    # Traditional API source keys
-    API_SOURCES = {
-        "alpha_vantage_news",
-        "alpha_vantage_sentiment",
-        "yahoo_finance_gainers",
-        "yahoo_finance_losers",
-    }
-
     # Validate category
     if category not in DATA_USE_CATEGORIES:
         return {
@@ -564,9 +731,6 @@ async def get_scraped_category_data(
     end_date = date.today()
     start_date = end_date - timedelta(days=days - 1)
 
-    # Categories that contain stock data and should be normalized
-    STOCK_CATEGORIES = {"top_gainers", "top_losers", "hot_stocks"}
-
     # Combine data from all sources
     combined_data = []
     sources = []
@@ -577,7 +741,7 @@ async def get_scraped_category_data(
 
     if configured_sources:
         for src in configured_sources:
-            if src in API_SOURCES:
+            if src in _API_SOURCES:
                 api_sources_to_fetch.add(src)
             else:
                 web_sources_to_fetch.append(src)
@@ -585,30 +749,21 @@ async def get_scraped_category_data(
         # No specific sources configured - don't include any data
         pass
 
-    # Fetch data from traditional API sources
-    if "yahoo_finance_gainers" in api_sources_to_fetch and category == "top_gainers":
-        data, source_info = await _get_yahoo_finance_top_movers("top_gainers")
-        if data and source_info:
-            sources.append(source_info)
-            # Normalize stock data
-            normalized = [_normalize_stock_data(item, category) for item in data if isinstance(item, dict)]
-            combined_data.extend(normalized)
-
-    if "yahoo_finance_losers" in api_sources_to_fetch and category == "top_losers":
-        data, source_info = await _get_yahoo_finance_top_movers("top_losers")
-        if data and source_info:
-            sources.append(source_info)
-            # Normalize stock data
-            normalized = [_normalize_stock_data(item, category) for item in data if isinstance(item, dict)]
-            combined_data.extend(normalized)
+    # Start the Yahoo Finance fetch first so its HTTP round-trip overlaps the
+    # database queries below (which must stay serial on the one session)
+    movers_fetch = None
+    if (
+        ("yahoo_finance_gainers" in api_sources_to_fetch and category == "top_gainers")
+        or ("yahoo_finance_losers" in api_sources_to_fetch and category == "top_losers")
+    ):
+        movers_fetch = asyncio.create_task(_get_yahoo_finance_top_movers(category))
 
+    news_data, news_source = [], None
     if "alpha_vantage_news" in api_sources_to_fetch and category == "news":
-        data, source_info = await _get_alpha_vantage_news(db)
-        if data and source_info:
-            sources.append(source_info)
-            combined_data.extend(data)
+        news_data, news_source = await _get_alpha_vantage_news(db)
 
     # Fetch data from web-scraped sources (if any configured)
+    records = []
     if web_sources_to_fetch:
         query_conditions = [
             ScrapedCategoryData.category == category,
@@ -625,54 +780,50 @@ async def get_scraped_category_data(
         result = await db.execute(stmt)
         records = result.scalars().all()
 
-        for record in records:
-            sources.append({
-                "source_key": record.source_key,
-                "source_url": record.source_url,
-                "date": record.date.isoformat(),
-                "scraping_model": record.scraping_model,
-            })
-
-            # Extract the actual data items
-            data = record.data
-            items = []
-
-            if isinstance(data, dict):
-                # Check for common data keys
-                if "stocks" in data:
-                    items = data["stocks"]
-                elif "sectors" in data:
-                    items = data["sectors"]
-                elif "ratings" in data:
-                    items = data["ratings"]
-                elif "articles" in data:
-                    items = data["articles"]
-                elif "holdings" in data:
-                    items = data["holdings"]
-                elif "changes" in data:
-                    items = data["changes"]
-                else:
-                    # If no known key, include the whole data object
-                    items = [data]
-            elif isinstance(data, list):
-                items = data
-
-            # Normalize stock data for stock-related categories
-            if category in STOCK_CATEGORIES and items:
-                items = [_normalize_stock_data(item, category) for item in items if isinstance(item, dict)]
-
-            combined_data.extend(items)
-
-    # Sort by change_pct for top_gainers/top_losers
-    if category == "top_gainers":
-        combined_data.sort(key=lambda x: x.get("change_pct", 0) if isinstance(x, dict) else 0, reverse=True)
-    elif category == "top_losers":
-        combined_data.sort(key=lambda x: x.get("change_pct", 0) if isinstance(x, dict) else 0)
+    # Combine traditional API sources first, then web-scraped ones
+    if movers_fetch is not None:
+        data, source_info = await movers_fetch
+        if data and source_info:
+            sources.append(source_info)
+            # Normalize stock data
+            normalized = [_normalize_stock_data(item, category) for item in data if isinstance(item, dict)]
+            combined_data.extend(normalized)
+
+    if news_data and news_source:
+        sources.append(news_source)
+        combined_data.extend(news_data)
+
+    for record in records:
+        sources.append({
+            "source_key": record.source_key,
+            "source_url": record.source_url,
+            "date": record.date,
+            "scraping_model": record.scraping_model,
+        })
+
+        # Extract the actual data items
+        data = record.data
+        items = []
+
+        if isinstance(data, dict):
+            # Use the first common data key; if none, include the whole data object
+            items = next((data[key] for key in _SCRAPED_DATA_KEYS if key in data), [data])
+        elif isinstance(data, list):
+            items = data
+
+        # Normalize stock data for stock-related categories
+        if category in _STOCK_CATEGORIES and items:
+            items = [_normalize_stock_data(item, category) for item in items if isinstance(item, dict)]
+
+        combined_data.extend(items)
+
+    # Sort by change_pct for top_gainers/top_losers (items are normalized, so
+    # every one is a dict with a float change_pct)
+    if category in ("top_gainers", "top_losers"):
+        combined_data.sort(key=_BY_CHANGE_PCT, reverse=category == "top_gainers")
     elif category == "news" and len(sources) > 1:
         # Interleave news from multiple sources to show variety
         # Group items by source, then interleave
-        from itertools import zip_longest
-
         source_groups = {}
         for item in combined_data:
             # Try to identify source from item fields
@@ -691,42 +842,42 @@ async def get_scraped_category_data(
                 source_groups[source_key] = []
             source_groups[source_key].append(item)
 
-        # Interleave items from different sources
+        # Interleave items from different sources (round-robin until each
+        # group runs out)
         interleaved = []
-        for items in zip_longest(*source_groups.values(), fillvalue=None):
-            for item in items:
-                if item is not None:
-                    interleaved.append(item)
+        groups = deque(iter(group) for group in source_groups.values())
+        while groups:
+            group = groups.popleft()
+            item = next(group, _EXHAUSTED)
+            if item is not _EXHAUSTED:
+                interleaved.append(item)
+                groups.append(group)
         combined_data = interleaved
 
-    return {
+    return ORJSONResponse({
         "success": True,
         "category": category,
         "category_display": DATA_USE_DISPLAY_NAMES.get(category, category),
         "date_range": {
-            "start": start_date.isoformat(),
-            "end": end_date.isoformat(),
+            "start": start_date,
+            "end": end_date,
         },
         "sources": sources,
         "data": combined_data,
         "count": len(combined_data),
         "configured_sources": configured_sources,  # None means all sources, list means only those sources
         "has_configured_sources": configured_sources is not None,
-    }
+    })
 
 
 @router.get("/scraped-data")
 async def get_all_scraped_categories(
     db: AsyncSession = Depends(get_db),
-) -> dict:
+) -> Response:
     """Get summary of all available scraped category data.
 
     Returns a list of categories that have data available, with counts and source information.
     """
-    from sqlalchemy import func
-    from backend.app.db.models import ScrapedCategoryData
-    from backend.app.schemas.config import DATA_USE_DISPLAY_NAMES
-
     today = date.today()
 
     # Get counts by category for today
@@ -747,11 +898,11 @@ async def get_all_scraped_categories(
             "category": row.category,
             "display_name": DATA_USE_DISPLAY_NAMES.get(row.category, row.category),
             "source_count": row.source_count,
-            "date": today.isoformat(),
+            "date": today,
         })
 
-    return {
+    return ORJSONResponse({
         "success": True,
-        "date": today.isoformat(),
+        "date": today,
         "categories": categories,
-    }
+    })
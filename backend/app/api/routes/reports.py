@@ -2,38 +2,45 @@
 
 from typing import Annotated
 
-from fastapi import APIRouter, Depends, Path, Query
+from fastapi import APIRouter, Depends, Path, Query, Request
 from fastapi.responses import Response
-from sqlalchemy import select
+from sqlalchemy import bindparam, select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from backend.app.core.exceptions import NotFoundException
+from backend.app.core.http_cache import conditional_response
 from backend.app.db.models import StockAnalysis, MarketSentiment
 from backend.app.db.session import get_db
 
 router = APIRouter()
 
+# Report lookups, built once and executed with bound parameters so requests
+# skip statement construction and hit the compiled-statement cache.
+_LATEST_ANALYSIS_STMT = (
+    select(StockAnalysis)
+    .where(StockAnalysis.ticker == bindparam("ticker"))
+    .order_by(StockAnalysis.analysis_date.desc())
+    .limit(1)
+)
+_LATEST_SENTIMENT_STMT = select(MarketSentiment).order_by(MarketSentiment.date.desc()).limit(1)
+
 
 @router.get("/stock/{ticker}")
 async def get_stock_report(
+    request: Request,
     ticker: Annotated[str, Path(min_length=1, max_length=10)],
     format: str = Query(default="html", pattern="^(html|pdf)$"),
     db: AsyncSession = Depends(get_db),
 ) -> Response:
     """Generate a comprehensive stock analysis report.
 
-    Returns either HTML preview or PDF download.
+    Returns either HTML preview or PDF download. HTML previews carry a content
+    ETag; a matching If-None-Match gets a 304.
     """
     ticker = ticker.upper()
 
     # Get latest analysis
-    stmt = (
-        select(StockAnalysis)
-        .where(StockAnalysis.ticker == ticker)
-        .order_by(StockAnalysis.analysis_date.desc())
-        .limit(1)
-    )
-    result = await db.execute(stmt)
+    result = await db.execute(_LATEST_ANALYSIS_STMT, {"ticker": ticker})
     analysis = result.scalar_one_or_none()
 
     if not analysis:
@@ -43,9 +50,9 @@ async def get_stock_report(
     html_content = _generate_stock_report_html(analysis)
 
     if format == "html":
-        return Response(
-            content=html_content,
-            media_type="text/html",
+        return conditional_response(
+            request,
+            Response(content=html_content, media_type="text/html"),
         )
     else:
         # Generate PDF using WeasyPrint
@@ -62,13 +69,16 @@ async def get_stock_report(
 
 @router.get("/market")
 async def get_market_report(
+    request: Request,
     format: str = Query(default="html", pattern="^(html|pdf)$"),
     db: AsyncSession = Depends(get_db),
 ) -> Response:
-    """Generate a market sentiment report."""
+    """Generate a market sentiment report.
+
+    HTML reports carry a content ETag; a matching If-None-Match gets a 304.
+    """
     # Get latest sentiment
-    stmt = select(MarketSentiment).order_by(MarketSentiment.date.desc()).limit(1)
-    result = await db.execute(stmt)
+    result = await db.execute(_LATEST_SENTIMENT_STMT)
     sentiment = result.scalar_one_or_none()
 
     if not sentiment:
@@ -80,9 +90,9 @@ async def get_market_report(
     html_content = _generate_market_report_html(sentiment)
 
     if format == "html":
-        return Response(
-            content=html_content,
-            media_type="text/html",
+        return conditional_response(
+            request,
+            Response(content=html_content, media_type="text/html"),
         )
     else:
         pdf_content = b"PDF generation not yet implemented"
@@ -21,6 +21,7 @@ from backend.app.schemas.config import (
     ScrapedWebsiteTestRequest,
     ScrapedWebsiteTestResponse,
 )
+from backend.app.services.cache import market_scraping_config_cache
 
 router = APIRouter()
 logger = structlog.get_logger(__name__)
@@ -164,6 +165,7 @@ async def create_website(
     db.add(website)
     await db.commit()
     await db.refresh(website)
+    market_scraping_config_cache.invalidate()
 
     logger.info("Created scraped website", key=website.key, name=website.name)
 
@@ -213,6 +215,7 @@ async def update_website(
 
     await db.commit()
     await db.refresh(website)
+    market_scraping_config_cache.invalidate()
 
     logger.info("Updated scraped website", key=website.key)
 
@@ -237,6 +240,7 @@ async def delete_website(
 
     await db.delete(website)
     await db.commit()
+    market_scraping_config_cache.invalidate()
 
     logger.info("Deleted scraped website", key=key)
 
@@ -17,6 +17,7 @@ celery_app = Celery(
         "backend.app.tasks.market",
         "backend.app.tasks.funds",
         "backend.app.tasks.etfs",
+        "backend.app.tasks.health",
     ],
 )
 
@@ -51,4 +52,8 @@ celery_app.conf.beat_schedule = {
         "task": "backend.app.tasks.etfs.refresh_all_etfs",
         "schedule": crontab(hour=0, minute=0),  # Daily at midnight
     },
+    "health-checks-refresh": {
+        "task": "backend.app.tasks.health.refresh_health_checks",
+        "schedule": 60.0,  # Every minute
+    },
 }
@@ -53,6 +53,13 @@ class Settings(BaseSettings):
     postgres_user: str = Field(default="stockuser", description="Database user")
     postgres_password: str = Field(default="", description="Database password")
     database_url: str | None = Field(default=None, description="Full database URL")
+    db_pool_size: int = Field(default=20, description="Persistent DB connections per process")
+    db_max_overflow: int = Field(default=10, description="Extra DB connections allowed under burst")
+    db_pool_timeout: int = Field(default=30, description="Seconds to wait for a pooled connection")
+    db_use_null_pool: bool = Field(
+        default=False,
+        description="Disable app-side pooling (e.g. behind PgBouncer transaction pooling)",
+    )
 
     @property
     def async_database_url(self) -> str:
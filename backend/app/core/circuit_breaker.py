@@ -0,0 +1,78 @@
+"""Circuit breaker for flaky external dependencies."""
+
+import time
+from enum import Enum
+
+import structlog
+
+logger = structlog.get_logger(__name__)
+
+
+class CircuitState(str, Enum):
+    """Circuit breaker states."""
+
+    CLOSED = "closed"  # Calls flow normally
+    OPEN = "open"  # Calls are refused without touching the dependency
+    HALF_OPEN = "half_open"  # Trial calls probe whether the dependency recovered
+
+
+class CircuitBreaker:
+    """Closed/open/half-open circuit breaker.
+
+    The circuit opens after ``failure_threshold`` consecutive failures and
+    refuses calls for ``open_timeout`` seconds. It then lets trial calls
+    through (half-open); ``recovery_threshold`` consecutive successes close
+    it again, while any failure re-opens it.
+    """
+
+    def __init__(
+        self,
+        name: str,
+        failure_threshold: int = 3,
+        recovery_threshold: int = 2,
+        open_timeout: float = 30.0,
+    ) -> None:
+        self.name = name
+        self.failure_threshold = failure_threshold
+        self.recovery_threshold = recovery_threshold
+        self.open_timeout = open_timeout
+        self._state = CircuitState.CLOSED
+        self._failures = 0
+        self._successes = 0
+        self._opened_at = 0.0
+
+    @property
+    def state(self) -> CircuitState:
+        """Current state, moving from open to half-open once the timeout passes."""
+        if (
+            self._state is CircuitState.OPEN
+            and time.monotonic() - self._opened_at >= self.open_timeout
+        ):
+            self._state = CircuitState.HALF_OPEN
+            self._successes = 0
+        return self._state
+
+    def allow_request(self) -> bool:
+        """Check whether a call to the dependency may go ahead."""
+        return self.state is not CircuitState.OPEN
+
+    def record_success(self) -> None:
+        """Record a successful call."""
+        self._failures = 0
+        if self.state is CircuitState.HALF_OPEN:
+            self._successes += 1
+            if self._successes >= self.recovery_threshold:
+                self._state = CircuitState.CLOSED
+                logger.info("Circuit closed", circuit=self.name)
+
+    def record_failure(self) -> None:
+        """Record a failed call, opening the circuit when warranted."""
+        self._failures += 1
+        if (
+            self.state is CircuitState.HALF_OPEN
+            or self._failures >= self.failure_threshold
+        ):
+            if self._state is not CircuitState.OPEN:
+                logger.warning("Circuit opened", circuit=self.name, failures=self._failures)
+            self._state = CircuitState.OPEN
+            self._opened_at = time.monotonic()
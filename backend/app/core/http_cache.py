@@ -0,0 +1,50 @@
+"""HTTP conditional request helpers (ETag / If-None-Match)."""
+
+import hashlib
+from typing import Any
+
+from fastapi import Request, Response, status
+
+
+def make_etag(*parts: Any) -> str:
+    """Build a weak ETag from the given version parts."""
+    return 'W/"' + "-".join(str(p) for p in parts) + '"'
+
+
+def make_content_etag(body: bytes) -> str:
+    """Build a weak ETag from a hash of the response body."""
+    return make_etag(hashlib.blake2b(body, digest_size=8).hexdigest())
+
+
+def is_not_modified(request: Request, etag: str) -> bool:
+    """Check whether the client already holds the representation for etag."""
+    if_none_match = request.headers.get("if-none-match")
+    if not if_none_match:
+        return False
+    if if_none_match.strip() == "*":
+        return True
+    return etag in (tag.strip() for tag in if_none_match.split(","))
+
+
+def not_modified_response(etag: str, cache_control: str | None = None) -> Response:
+    """Build an empty 304 Not Modified response carrying the ETag."""
+    headers = {"ETag": etag}
+    if cache_control:
+        headers["Cache-Control"] = cache_control
+    return Response(
+        status_code=status.HTTP_304_NOT_MODIFIED,
+        headers=headers,
+    )
+
+
+def conditional_response(
+    request: Request, response: Response, cache_control: str | None = None
+) -> Response:
+    """Tag a rendered response with a body ETag, or answer 304 on a match."""
+    etag = make_content_etag(response.body)
+    if is_not_modified(request, etag):
+        return not_modified_response(etag, cache_control)
+    response.headers["ETag"] = etag
+    if cache_control:
+        response.headers["Cache-Control"] = cache_control
+    return response
@@ -16,6 +16,7 @@ from sqlalchemy import (
     Numeric,
     String,
     Text,
+    text,
     UniqueConstraint,
     func,
 )
@@ -120,6 +121,26 @@ class FundHolding(Base):
     __table_args__ = (
         Index("idx_holding_fund_date", "fund_id", "filing_date"),
         Index("idx_holding_ticker_date", "ticker", "filing_date"),
+        Index(
+            "idx_holding_fund_date_value",
+            "fund_id",
+            text("filing_date DESC"),
+            text("value DESC"),
+            postgresql_include=[
+                "ticker",
+                "company_name",
+                "shares",
+                "percentage",
+                "change_type",
+                "shares_change",
+            ],
+        ),
+        Index(
+            "idx_holding_filing_change",
+            "filing_date",
+            "change_type",
+            postgresql_where=text("change_type IS NOT NULL"),
+        ),
     )
 
 
@@ -320,7 +341,7 @@ class ScrapedCategoryData(Base):
     source_url: Mapped[str] = mapped_column(String(500), nullable=False)
 
     # Category identification
-    category: Mapped[str] = mapped_column(String(50), nullable=False, index=True)
+    category: Mapped[str] = mapped_column(String(50), nullable=False)
 
     # The actual data for this category (JSON)
     data: Mapped[dict] = mapped_column(PortableJSON, nullable=False)
@@ -339,6 +360,14 @@ class ScrapedCategoryData(Base):
     # Composite unique constraint: one record per date/source/category
     __table_args__ = (
         Index("ix_scraped_category_data_date_category", "date", "category"),
+        Index(
+            "ix_scraped_category_data_category_date_source",
+            "category",
+            text("date DESC"),
+            "source_key",
+            text("created_at DESC"),
+            postgresql_include=["source_url", "scraping_model"],
+        ),
         {"sqlite_autoincrement": True},
     )
 
@@ -588,6 +617,14 @@ class ScrapedWebsite(Base):
     """User-configured websites for scraping data."""
 
     __tablename__ = "scraped_websites"
+    __table_args__ = (
+        # Partial index so counting active websites scans only active rows
+        Index(
+            "idx_scraped_website_active",
+            "id",
+            postgresql_where=text("is_active"),
+        ),
+    )
 
     id: Mapped[int] = mapped_column(Integer, primary_key=True, autoincrement=True)
     key: Mapped[str] = mapped_column(String(100), nullable=False, unique=True, index=True)
@@ -8,19 +8,32 @@ from sqlalchemy.ext.asyncio import (
     create_async_engine,
 )
 from sqlalchemy.orm import declarative_base
+from sqlalchemy.pool import NullPool
 
 from backend.app.config import get_settings
 
 settings = get_settings()
 
+# Connection pooling: keep warm connections so requests skip the TCP/TLS
+# handshake, or hand pooling off to PgBouncer when configured.
+if settings.db_use_null_pool:
+    pool_kwargs: dict = {"poolclass": NullPool}
+else:
+    pool_kwargs = {
+        "pool_size": settings.db_pool_size,
+        "max_overflow": settings.db_max_overflow,
+        "pool_timeout": settings.db_pool_timeout,
+        "pool_pre_ping": True,
+        "pool_recycle": 3600,
+    }
+
 # Create async engine
 engine = create_async_engine(
     settings.async_database_url,
     echo=settings.debug,
-    pool_size=10,
-    max_overflow=20,
-    pool_pre_ping=True,
-    pool_recycle=3600,
+    # Room for the per-entity statement variants issued by the API routes
+    query_cache_size=1200,
+    **pool_kwargs,
 )
 
 # Create session factory
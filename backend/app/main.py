@@ -1,5 +1,6 @@
 """Main FastAPI application entry point."""
 
+import asyncio
 import logging
 from contextlib import asynccontextmanager
 from typing import AsyncGenerator
@@ -11,8 +12,13 @@ from fastapi.middleware.cors import CORSMiddleware
 from fastapi.responses import JSONResponse
 
 from backend.app.api.routes import market, stocks, funds, etfs, reports, websocket, health, config, websites
+from backend.app.api.routes.health import (
+    close_health_http_client,
+    prewarm_health_http_client,
+)
 from backend.app.config import get_settings
 from backend.app.core.exceptions import StockResearchException
+from backend.app.core.responses import ORJSONResponse
 from backend.app.db.session import close_db, init_db
 from backend.app.services.cache import get_redis_client, close_redis
 
@@ -57,13 +63,19 @@ async def lifespan(app: FastAPI) -> AsyncGenerator[None, None]:
             await redis.ping()
             logger.info("Redis connected")
 
+        # Warm health probe connections without delaying startup
+        prewarm_task = asyncio.create_task(prewarm_health_http_client())
+
         yield
 
+        prewarm_task.cancel()
+
     finally:
         # Shutdown
         logger.info("Shutting down Stock Research Tool API")
         await close_db()
         await close_redis()
+        await close_health_http_client()
         logger.info("Connections closed")
 
 
@@ -75,6 +87,7 @@ app = FastAPI(
     docs_url="/docs" if settings.debug else None,
     redoc_url="/redoc" if settings.debug else None,
     lifespan=lifespan,
+    default_response_class=ORJSONResponse,
 )
 
 # Configure CORS
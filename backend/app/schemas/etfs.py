@@ -130,6 +130,7 @@ class ETFRefreshResponse(BaseModel):
 
     message: str
     etfs_queued: int
+    job_id: str | None = None
 
 
 class ETFSingleRefreshResponse(BaseModel):
@@ -1,6 +1,7 @@
 """Redis caching service."""
 
 import json
+import time
 from typing import Any
 
 import redis.asyncio as redis
@@ -121,6 +122,23 @@ class CacheService:
             logger.warning("Cache exists error", key=key, error=str(e))
             return False
 
+    async def claim(self, key: str, value: Any, ttl: int) -> bool:
+        """Store value only if key is absent (SET NX) for ttl seconds.
+
+        Returns False only when another caller already holds the key; when
+        Redis is unavailable the claim succeeds so work is not blocked.
+        """
+        client = await get_redis_client()
+        if not client:
+            return True
+
+        try:
+            serialized = json.dumps(value, default=str)
+            return bool(await client.set(self._make_key(key), serialized, ex=ttl, nx=True))
+        except Exception as e:
+            logger.warning("Cache claim error", key=key, error=str(e))
+            return True
+
     async def get_or_set(
         self,
         key: str,
@@ -166,6 +184,59 @@ class CacheService:
             return 0
 
 
+class LocalTTLCache:
+    """In-process TTL cache for small, slow-changing lookups.
+
+    Entries live per worker process, so callers should keep the TTL short and
+    invalidate explicitly when they change the underlying data.
+    """
+
+    def __init__(self, ttl: float) -> None:
+        self.ttl = ttl
+        self._entries: dict[str, tuple[float, Any]] = {}
+        _local_caches.append(self)
+
+    def get(self, key: str = "default") -> Any | None:
+        """Get value if present and not expired."""
+        entry = self._entries.get(key)
+        if entry is None:
+            return None
+        expires_at, value = entry
+        if time.monotonic() >= expires_at:
+            del self._entries[key]
+            return None
+        return value
+
+    def set(self, key: str, value: Any) -> None:
+        """Store value for the configured TTL, dropping expired entries."""
+        now = time.monotonic()
+        expired = [k for k, (expires_at, _) in self._entries.items() if now >= expires_at]
+        for k in expired:
+            del self._entries[k]
+        self._entries[key] = (now + self.ttl, value)
+
+    def invalidate(self, key: str | None = None) -> None:
+        """Drop one key, or every key when none is given."""
+        if key is None:
+            self._entries.clear()
+        else:
+            self._entries.pop(key, None)
+
+
+_local_caches: list[LocalTTLCache] = []
+
+
+def clear_local_caches() -> None:
+    """Invalidate every in-process cache, e.g. between tests."""
+    for local_cache in _local_caches:
+        local_cache.invalidate()
+
+
+# Assembled /market/scraping-config payload. Invalidated by the scraped
+# website CRUD routes; the TTL bounds staleness across workers.
+market_scraping_config_cache = LocalTTLCache(ttl=60)
+
+
 # Cache key builders
 def stock_price_key(ticker: str, date: str) -> str:
     """Build cache key for stock price."""
@@ -182,11 +253,34 @@ def market_sentiment_key(date: str) -> str:
     return f"sentiment:{date}"
 
 
+def market_sentiment_view_key(kind: str, date: str, days: int | None = None) -> str:
+    """Build cache key for an assembled market sentiment response."""
+    key = f"market:sentiment:{kind}:{date}"
+    return f"{key}:{days}" if days is not None else key
+
+
+MARKET_SENTIMENT_PATTERN = "market:sentiment:*"
+
+
+def refresh_lock_key(job: str, *parts: str | None) -> str:
+    """Build cache key marking a queued refresh job (parts default to "default")."""
+    return ":".join(["refresh", job, *(part or "default" for part in parts)])
+
+
 def fund_holdings_key(fund_id: int, date: str) -> str:
     """Build cache key for fund holdings."""
     return f"holdings:{fund_id}:{date}"
 
 
+def fund_aggregate_key(kind: str, date: str, limit: int | None = None) -> str:
+    """Build cache key for cross-fund aggregates."""
+    key = f"funds:aggregate:{kind}:{date}"
+    return f"{key}:{limit}" if limit is not None else key
+
+
+FUND_AGGREGATE_PATTERN = "funds:aggregate:*"
+
+
 def news_key(source: str, query: str) -> str:
     """Build cache key for news."""
     return f"news:{source}:{query}"
@@ -5,6 +5,8 @@ using the OpenFIGI API with Redis caching.
 """
 
 import asyncio
+import re
+from functools import lru_cache
 from typing import Any
 
 import httpx
@@ -79,9 +81,16 @@ def cusip_to_ticker(cusip: str) -> str | None:
     return CUSIP_TO_TICKER.get(cusip)
 
 
+# CUSIPs are typically 9 alphanumeric characters
+_CUSIP_PATTERN = re.compile(r"[0-9A-Za-z]{9}")
+
+
+@lru_cache(maxsize=131072)
 def is_cusip(identifier: str) -> bool:
     """Check if string looks like a CUSIP (9 alphanumeric characters).
 
+    Results are memoized since the same tickers recur across funds and filings.
+
     Args:
         identifier: String to check
 
@@ -90,8 +99,7 @@ def is_cusip(identifier: str) -> bool:
     """
     if not identifier:
         return False
-    # CUSIPs are typically 9 characters
-    return len(identifier) == 9 and identifier.isalnum()
+    return _CUSIP_PATTERN.fullmatch(identifier) is not None
 
 
 async def lookup_cusip_openfigi(cusip: str) -> str | None:
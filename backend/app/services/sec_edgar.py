@@ -1,5 +1,6 @@
 """SEC EDGAR API client for 13F filings."""
 
+import asyncio
 import re
 from datetime import date, datetime
 from decimal import Decimal
@@ -27,6 +28,9 @@ class SECEdgarClient:
     WWW_URL = "https://www.sec.gov"
     SUBMISSIONS_URL = "https://data.sec.gov/submissions"
 
+    # Max concurrent submissions lookups in batch calls
+    BATCH_CONCURRENCY = 5
+
     def __init__(self) -> None:
         self.user_agent = settings.sec_user_agent
         self.rate_limiter = get_sec_edgar_limiter()
@@ -126,6 +130,33 @@ class SECEdgarClient:
         logger.info("Found 13F filings", cik=cik, count=len(result))
         return result
 
+    async def get_13f_filings_batch(self, ciks: list[str]) -> dict[str, list[dict[str, Any]]]:
+        """Get 13F-HR filings for several CIKs concurrently.
+
+        SEC EDGAR has no multi-CIK submissions endpoint, so lookups fan out
+        over the shared HTTP client, bounded by BATCH_CONCURRENCY and paced by
+        the rate limiter. A CIK whose lookup fails maps to an empty list.
+
+        Args:
+            ciks: Central Index Keys
+
+        Returns:
+            Mapping of CIK to its 13F filing metadata
+        """
+        semaphore = asyncio.Semaphore(self.BATCH_CONCURRENCY)
+
+        async def fetch(cik: str) -> list[dict[str, Any]]:
+            async with semaphore:
+                try:
+                    return await self.get_13f_filings(cik)
+                except Exception as e:
+                    logger.warning("13F lookup failed", cik=cik, error=str(e))
+                    return []
+
+        unique_ciks = list(dict.fromkeys(ciks))
+        results = await asyncio.gather(*(fetch(cik) for cik in unique_ciks))
+        return dict(zip(unique_ciks, results))
+
     async def get_latest_13f(self, cik: str) -> dict[str, Any] | None:
         """Get the most recent 13F-HR filing.
 
@@ -1,5 +1,6 @@
 """Yahoo Finance client for stock data."""
 
+import asyncio
 from datetime import date, datetime, timedelta
 from decimal import Decimal
 from typing import Any
@@ -216,7 +217,11 @@ class YahooFinanceClient:
 
         try:
             stock = yf.Ticker(ticker)
-            history = stock.history(period=period, interval=interval)
+            # yfinance blocks on network I/O; run it in a worker thread so
+            # concurrent history requests overlap instead of stalling the loop
+            history = await asyncio.to_thread(
+                stock.history, period=period, interval=interval
+            )
 
             if history.empty:
                 raise DataSourceException(
@@ -224,16 +229,31 @@ class YahooFinanceClient:
                     source="yahoo_finance",
                 )
 
-            prices = []
-            for idx, row in history.iterrows():
-                prices.append({
-                    "date": idx.strftime("%Y-%m-%d") if hasattr(idx, "strftime") else str(idx),
-                    "open": Decimal(str(row["Open"])),
-                    "high": Decimal(str(row["High"])),
-                    "low": Decimal(str(row["Low"])),
-                    "close": Decimal(str(row["Close"])),
-                    "volume": int(row["Volume"]),
-                })
+            # Convert whole columns at once instead of materializing a Series
+            # per row with iterrows()
+            dates = (
+                history.index.strftime("%Y-%m-%d").tolist()
+                if hasattr(history.index, "strftime")
+                else [str(idx) for idx in history.index]
+            )
+            prices = [
+                {
+                    "date": day,
+                    "open": Decimal(str(open_)),
+                    "high": Decimal(str(high)),
+                    "low": Decimal(str(low)),
+                    "close": Decimal(str(close)),
+                    "volume": int(volume),
+                }
+                for day, open_, high, low, close, volume in zip(
+                    dates,
+                    history["Open"].tolist(),
+                    history["High"].tolist(),
+                    history["Low"].tolist(),
+                    history["Close"].tolist(),
+                    history["Volume"].tolist(),
+                )
+            ]
 
             # Cache based on interval
             ttl = CacheService.TTL_SHORT if interval in ("1m", "5m") else CacheService.TTL_MEDIUM
@@ -219,6 +219,7 @@ def refresh_all_etfs() -> dict[str, Any]:
             logger.info("No active ETFs to refresh")
             return {
                 "date": date.today().isoformat(),
+                "etfs_queued": 0,
                 "etfs_processed": 0,
                 "total_holdings": 0,
                 "errors": ["No ETFs configured"],
@@ -226,6 +227,7 @@ def refresh_all_etfs() -> dict[str, Any]:
 
         results = {
             "date": date.today().isoformat(),
+            "etfs_queued": len(etf_configs),
             "etfs_processed": 0,
             "total_holdings": 0,
             "etf_results": [],
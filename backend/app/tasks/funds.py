@@ -36,6 +36,7 @@ def check_fund_holdings() -> dict[str, Any]:
         save_holdings_to_db,
     )
     from datetime import date
+    from backend.app.services.cache import FUND_AGGREGATE_PATTERN, cache
 
     async def run():
         logger.info("Starting fund holdings check")
@@ -89,6 +90,9 @@ def check_fund_holdings() -> dict[str, Any]:
             # Small delay between funds
             await asyncio.sleep(1)
 
+        if results["funds_processed"]:
+            await cache.invalidate_pattern(FUND_AGGREGATE_PATTERN)
+
         logger.info(
             "Fund holdings check completed",
             funds=results["funds_processed"],
@@ -113,6 +117,7 @@ def refresh_single_fund(fund_id: int) -> dict[str, Any]:
     from sqlalchemy import select
     from backend.app.db.session import async_session_factory
     from backend.app.db.models import Fund
+    from backend.app.services.cache import FUND_AGGREGATE_PATTERN, cache
     from pipelines.assets.fund_holdings import fetch_fund_holdings, save_holdings_to_db
 
     async def run():
@@ -134,6 +139,7 @@ def refresh_single_fund(fund_id: int) -> dict[str, Any]:
 
         if fund_data["success"]:
             count = await save_holdings_to_db(fund_data)
+            await cache.invalidate_pattern(FUND_AGGREGATE_PATTERN)
             return {
                 "fund_id": fund_id,
                 "name": fund.name,
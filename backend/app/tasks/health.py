@@ -0,0 +1,58 @@
+"""Health check Celery tasks."""
+
+import asyncio
+from typing import Any
+
+import structlog
+
+from backend.app.celery_app import celery_app
+
+logger = structlog.get_logger(__name__)
+
+# External sources probed in the background so API health reads hit the cache
+PERIODIC_HEALTH_CHECKS = (
+    "alpha_vantage",
+    "yahoo_finance",
+    "sec_edgar",
+    "openfigi",
+    "nordvpn",
+)
+
+# Outlives the beat interval so the cached results never lapse between runs
+PERIODIC_HEALTH_TTL = 120
+
+
+def run_async(coro):
+    """Run async function in sync context."""
+    try:
+        loop = asyncio.get_event_loop()
+        if loop.is_closed():
+            loop = asyncio.new_event_loop()
+            asyncio.set_event_loop(loop)
+    except RuntimeError:
+        loop = asyncio.new_event_loop()
+        asyncio.set_event_loop(loop)
+
+    return loop.run_until_complete(coro)
+
+
+@celery_app.task(name="backend.app.tasks.health.refresh_health_checks")
+def refresh_health_checks() -> dict[str, Any]:
+    """Probe external data sources and cache their health results.
+
+    This task is scheduled to run every minute.
+    """
+    from backend.app.api.routes.health import run_check
+
+    async def run():
+        results = await asyncio.gather(
+            *(run_check(name, ttl=PERIODIC_HEALTH_TTL) for name in PERIODIC_HEALTH_CHECKS)
+        )
+        statuses = {
+            name: result["status"]
+            for name, result in zip(PERIODIC_HEALTH_CHECKS, results)
+        }
+        logger.info("Health checks refreshed", statuses=statuses)
+        return statuses
+
+    return run_async(run())
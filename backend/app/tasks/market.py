@@ -38,6 +38,8 @@ def refresh_market_sentiment() -> dict[str, Any]:
     )
     from datetime import date
 
+    from backend.app.services.cache import MARKET_SENTIMENT_PATTERN, cache
+
     async def run():
         logger.info("Starting market sentiment refresh")
 
@@ -69,6 +71,7 @@ def refresh_market_sentiment() -> dict[str, Any]:
         # Save to database
         sentiment_id = await save_sentiment_to_db(result)
         result["sentiment_id"] = sentiment_id
+        await cache.invalidate_pattern(MARKET_SENTIMENT_PATTERN)
 
         logger.info("Market sentiment refresh completed", sentiment_id=sentiment_id)
         return result
@@ -103,6 +106,8 @@ def refresh_web_scraped_market(
     )
     from datetime import date
 
+    from backend.app.services.cache import MARKET_SENTIMENT_PATTERN, cache
+
     async def run():
         logger.info("Starting web-scraped market data refresh")
 
@@ -182,6 +187,7 @@ def refresh_web_scraped_market(
 
         record_id = await save_web_scraped_data_to_db(result)
         result["record_id"] = record_id
+        await cache.invalidate_pattern(MARKET_SENTIMENT_PATTERN)
         result["status"] = "success"
 
         logger.info(
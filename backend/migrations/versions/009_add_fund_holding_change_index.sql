@@ -0,0 +1,15 @@
+-- Migration: Add Partial Index for Fund Holding Changes
+-- Created: 2026-10-16
+-- Description: Adds a partial index on fund_holdings for rows carrying a
+--              change_type, used by the per-fund and aggregated changes
+--              endpoints. MAX(filing_date) per fund and per-filing holdings
+--              scans are already served by idx_holding_fund_date
+--              (fund_id, filing_date), which Postgres can scan backwards.
+
+-- CONCURRENTLY avoids blocking writes; run outside a transaction block
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_holding_filing_change
+    ON fund_holdings(filing_date, change_type)
+    WHERE change_type IS NOT NULL;
+
+-- Add comment for documentation
+COMMENT ON INDEX idx_holding_filing_change IS 'Partial index for holding change queries (new/increased/decreased/sold)';
@@ -0,0 +1,14 @@
+-- Migration: Add Covering Index for Latest Fund Holdings
+-- Created: 2026-10-16
+-- Description: Adds a covering index on fund_holdings ordered by filing date
+--              and value so the per-fund holdings/changes endpoints can find
+--              the latest filing and read its top holdings by value with an
+--              index-only range scan (no sort, no heap fetches)
+
+-- CONCURRENTLY avoids blocking writes; run outside a transaction block
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_holding_fund_date_value
+    ON fund_holdings(fund_id, filing_date DESC, value DESC)
+    INCLUDE (ticker, company_name, shares, percentage, change_type, shares_change);
+
+-- Add comment for documentation
+COMMENT ON INDEX idx_holding_fund_date_value IS 'Covering index for latest-filing holdings ordered by value';
@@ -0,0 +1,13 @@
+-- Migration: Add Partial Index for Active Scraped Websites
+-- Created: 2026-10-16
+-- Description: Adds a partial index on scraped_websites covering only active
+--              rows, so the web scraping health check's count of active
+--              websites is an index-only scan of active rows
+
+-- CONCURRENTLY avoids blocking writes; run outside a transaction block
+CREATE INDEX CONCURRENTLY IF NOT EXISTS idx_scraped_website_active
+    ON scraped_websites(id)
+    WHERE is_active;
+
+-- Add comment for documentation
+COMMENT ON INDEX idx_scraped_website_active IS 'Partial index for counting active scraped websites';
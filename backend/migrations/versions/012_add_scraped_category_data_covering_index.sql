@@ -0,0 +1,17 @@
+-- Migration: Add Covering Index for Scraped Category Data Lookups
+-- Created: 2026-10-16
+-- Description: Adds an index on scraped_category_data matching the
+--              /market/scraped-data/{category} query (category filter, date
+--              range, source_key list, newest first) so it is served by an
+--              index range scan without a sort. The single-column category
+--              index is a prefix of the new one and is dropped.
+
+-- CONCURRENTLY avoids blocking writes; run outside a transaction block
+CREATE INDEX CONCURRENTLY IF NOT EXISTS ix_scraped_category_data_category_date_source
+    ON scraped_category_data(category, date DESC, source_key, created_at DESC)
+    INCLUDE (source_url, scraping_model);
+
+DROP INDEX CONCURRENTLY IF EXISTS ix_scraped_category_data_category;
+
+-- Add comment for documentation
+COMMENT ON INDEX ix_scraped_category_data_category_date_source IS 'Covering index for per-category scraped data lookups ordered by date';
@@ -13,6 +13,7 @@ from sqlalchemy.ext.asyncio import AsyncSession, create_async_engine, async_sess
 from backend.app.main import app
 from backend.app.db.session import Base, get_db
 from backend.app.db.models import Fund, MarketSentiment, StockAnalysis
+from backend.app.services.cache import clear_local_caches
 
 
 # Test database URL (use SQLite for testing)
@@ -55,6 +56,9 @@ async def db_session() -> AsyncGenerator[AsyncSession, None]:
     async with test_engine.begin() as conn:
         await conn.run_sync(Base.metadata.drop_all)
 
+    # Forget in-process lookups that referenced the dropped rows
+    clear_local_caches()
+
 
 @pytest_asyncio.fixture(scope="function")
 async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
@@ -71,6 +75,45 @@ async def client(db_session: AsyncSession) -> AsyncGenerator[AsyncClient, None]:
     app.dependency_overrides.clear()
 
 
+class FakeRedis:
+    """Minimal in-memory stand-in for the async Redis client (TTLs ignored)."""
+
+    def __init__(self) -> None:
+        self.data: dict[str, str] = {}
+
+    async def get(self, key: str) -> str | None:
+        return self.data.get(key)
+
+    async def set(
+        self, key: str, value: str, ex: int | None = None, nx: bool = False
+    ) -> bool | None:
+        if nx and key in self.data:
+            return None
+        self.data[key] = value
+        return True
+
+    async def setex(self, key: str, ttl: int, value: str) -> bool:
+        self.data[key] = value
+        return True
+
+    async def delete(self, *keys: str) -> int:
+        return sum(self.data.pop(key, None) is not None for key in keys)
+
+
+@pytest.fixture
+def fake_redis(monkeypatch: pytest.MonkeyPatch) -> FakeRedis:
+    """Route the cache service to an in-memory Redis stand-in."""
+    from backend.app.services import cache as cache_module
+
+    redis = FakeRedis()
+
+    async def get_fake_redis_client() -> FakeRedis:
+        return redis
+
+    monkeypatch.setattr(cache_module, "get_redis_client", get_fake_redis_client)
+    return redis
+
+
 @pytest_asyncio.fixture
 async def sample_fund(db_session: AsyncSession) -> Fund:
     """Create a sample fund for testing."""